@@ -0,0 +1,86 @@
+import bisect
+import re
+
+JAVA_CLASS_RE = re.compile(r"\b(?:class|interface|enum|record)\s+([A-Za-z_]\w*)")
+JAVA_METHOD_RE = re.compile(
+    r"^[ \t]*(?:(?:public|private|protected|static|final|abstract|synchronized|default)\s+)*"
+    r"(?:<[^>]*>\s*)?[\w.<>\[\],? ]+?\s+([A-Za-z_]\w*)\s*\([^;{}]*\)\s*(?:throws\s+[\w.,\s]+)?\{",
+    re.MULTILINE,
+)
+JAVA_KEYWORDS = frozenset("if for while switch catch return new else do try synchronized".split())
+
+# Earlier kinds win when the same label shows up in several places.
+KINDS = ("module", "operation", "class", "method")
+
+
+class PrefixIndex:
+    """Sorted-array prefix index for search-box type-ahead.
+
+    Suggestions are built once as immutable dicts. A lookup is a bisect plus
+    a short forward walk that appends those same objects to the result list,
+    so nothing else is allocated per keystroke. Labels are matched from their
+    start first, then from the start of any later word ("sort" finds "Bubble
+    Sort").
+    """
+
+    def __init__(self, content):
+        seen = {}
+        for module in content:
+            seen.setdefault(("module", module), {"text": module, "kind": "module", "module": module, "level": None})
+        for module in content:
+            for level in content[module]:
+                entry = content[module][level]
+                for op in entry["time_complexity"]:
+                    seen.setdefault(("operation", op), _suggestion(op, "operation", module, level))
+                classes = JAVA_CLASS_RE.findall(entry["java"])
+                for name in classes:
+                    seen.setdefault(("class", name), _suggestion(name, "class", module, level))
+                for name in JAVA_METHOD_RE.findall(entry["java"]):
+                    if name not in JAVA_KEYWORDS and name not in classes:
+                        seen.setdefault(("method", name), _suggestion(name, "method", module, level))
+
+        suggestions = sorted(seen.values(), key=lambda s: KINDS.index(s["kind"]))
+        primary, secondary = [], []
+        for s in suggestions:
+            label = s["text"].lower()
+            primary.append((label, s))
+            for m in re.finditer(r"[\s(/_\-]+(?=\w)", label):
+                secondary.append((label[m.end():], s))
+        # Stable sorts keep the KINDS priority among equal keys.
+        primary.sort(key=lambda pair: pair[0])
+        secondary.sort(key=lambda pair: pair[0])
+        self._keys = [k for k, _ in primary]
+        self._values = [v for _, v in primary]
+        self._inner_keys = [k for k, _ in secondary]
+        self._inner_values = [v for _, v in secondary]
+
+    def __len__(self):
+        return len(self._values)
+
+    def complete(self, prefix: str, limit: int = 10):
+        prefix = prefix.lower()
+        out = []
+        if not prefix or limit <= 0:
+            return out
+        self._walk(self._keys, self._values, prefix, limit, out)
+        if len(out) < limit:
+            self._walk(self._inner_keys, self._inner_values, prefix, limit, out)
+        return out
+
+    @staticmethod
+    def _walk(keys, values, prefix, limit, out):
+        i = bisect.bisect_left(keys, prefix)
+        n = len(keys)
+        while i < n and len(out) < limit and keys[i].startswith(prefix):
+            if values[i] not in out:
+                out.append(values[i])
+            i += 1
+
+
+def _suggestion(text, kind, module, level):
+    return {"text": text, "kind": kind, "module": module, "level": level}
+
+
+def get_index(content) -> PrefixIndex:
+    """The prefix index over `content`, built on first use (see ContentStore.derived)."""
+    return content.derived(PrefixIndex)
@@ -0,0 +1,69 @@
+import json
+import os
+import re
+import sys
+
+from serialize import dumps
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "content")
+INDEX_FILE = "index.json"
+
+
+def slugify(module: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", module.lower()).strip("_")
+
+
+def write_module(directory: str, module: str, levels: dict) -> dict:
+    """Write one module file and return its index entry.
+
+    The file is a JSON object whose level values are stored in exactly the
+    bytes the API serves, one per line, so the loader can slice them out by
+    offset without parsing the rest of the file.
+    """
+    filename = slugify(module) + ".json"
+    out = bytearray(b'{"module":' + dumps(module) + b',"levels":{\n')
+    offsets = {}
+    for i, (level, entry) in enumerate(levels.items()):
+        out += dumps(level) + b":"
+        body = dumps(entry)
+        offsets[level] = [len(out), len(body)]
+        out += body
+        out += b",\n" if i < len(levels) - 1 else b"\n"
+    out += b"}}\n"
+    with open(os.path.join(directory, filename), "wb") as f:
+        f.write(out)
+    return {"file": filename, "levels": offsets}
+
+
+def build(directory: str = CONTENT_DIR) -> dict:
+    """Re-canonicalize every module file in `directory` and rewrite the offset index.
+
+    Modules keep their existing index order; files not yet indexed are
+    appended in filename order.
+    """
+    index_path = os.path.join(directory, INDEX_FILE)
+    order = []
+    if os.path.exists(index_path):
+        with open(index_path, encoding="utf-8") as f:
+            order = [entry["file"] for entry in json.load(f)["modules"].values()]
+    files = sorted(n for n in os.listdir(directory) if n.endswith(".json") and n != INDEX_FILE)
+    files = [n for n in order if n in files] + [n for n in files if n not in order]
+
+    modules = {}
+    for filename in files:
+        with open(os.path.join(directory, filename), encoding="utf-8") as f:
+            data = json.load(f)
+        modules[data["module"]] = write_module(directory, data["module"], data["levels"])
+
+    with open(index_path, "w", encoding="utf-8") as f:
+        f.write('{"modules": {\n')
+        f.write(",\n".join(
+            f"  {json.dumps(name, ensure_ascii=False)}: {json.dumps(info)}" for name, info in modules.items()
+        ))
+        f.write("\n}}\n")
+    return {"modules": modules}
+
+
+if __name__ == "__main__":
+    index = build(sys.argv[1] if len(sys.argv) > 1 else CONTENT_DIR)
+    print(f"Indexed {len(index['modules'])} modules")
@@ -0,0 +1,281 @@
+"""Pull simulator input out of the code a student pasted.
+
+The code is scanned once by a precompiled tokenizer into a CodeSummary
+(comment-free text, string literals, integer array literals, simple method
+calls, numeric assignments, indexing and bare integers). Each parser is
+registered against one or more algorithm ids (see visualizer_engine.parser)
+and reads what it needs from that summary, returning the request's own
+input when the code doesn't say anything useful.
+"""
+import re
+from typing import Any, List, Optional, Tuple
+
+import visualizer_engine as ve
+
+# Alternatives are tried in order at each position. Comments and strings
+# are consumed whole so nothing inside them counts, and the lookbehinds
+# keep names and numbers from starting mid-identifier (`a1` has no number).
+# Plain identifiers produce no token at all, which keeps the Python side
+# of the scan down to the tokens the parsers actually use.
+TOKEN_RE = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | "(?P<string>(?:[^"\\\n]|\\.)*)"
+  | (?P<open>[\[{])\s*(?P<items>-?\d+[\d\s,]*)(?P<close>[\]}])
+        (?:\s*=(?!=)\s*(?P<stored>-?\d+)|(?P<compared>\s*=))?
+  | (?<!\w)(?P<name>[A-Za-z_]\w*)\s*
+        (?:[:=](?!=)\s*(?P<value>-?\d+)|\((?=\s*(?P<args>[^()]*?)\s*\)))
+  | (?<!\w)(?P<number>\d+)(?!\w)
+""", re.VERBOSE | re.DOTALL)
+ITEM_SPLIT_RE = re.compile(r"[\s,]+")
+INT_RE = re.compile(r"-?\d+")
+
+
+class CodeSummary:
+    """Everything the parsers look at, from one pass over the code."""
+
+    __slots__ = ("text", "lower", "strings", "arrays", "indexes", "assignments", "calls", "numbers")
+
+    def __init__(self, code: str):
+        pieces = []
+        self.strings: List[str] = []
+        self.arrays: List[List[int]] = []
+        self.indexes: List[Tuple[int, Optional[int], bool]] = []  # (index, stored value, followed by '=')
+        self.assignments: List[Tuple[str, str]] = []  # (lower-cased name, integer text)
+        self.calls: List[Tuple[str, str]] = []        # (lower-cased name, argument text)
+        self.numbers: List[str] = []                  # every run of digits outside strings, in order
+        last = 0
+        for m in TOKEN_RE.finditer(code):
+            if m.group("comment"):
+                pieces.append(code[last:m.start()])
+                last = m.end()
+            elif m.group("string") is not None:
+                self.strings.append(m.group("string"))
+            elif m.group("open"):
+                items = m.group("items")
+                values = [n for n in ITEM_SPLIT_RE.split(items) if n.lstrip("-").isdigit()]
+                self.arrays.append([int(n) for n in values])
+                self.numbers.extend(n.lstrip("-") for n in values)
+                stored = m.group("stored")
+                if stored is not None:
+                    self.numbers.append(stored.lstrip("-"))
+                if m.group("open") == "[" and m.group("close") == "]" and items.strip().isdigit():
+                    stored = int(stored) if stored is not None else None
+                    compared = stored is None and m.group("compared") is not None
+                    self.indexes.append((int(items), stored, compared))
+            elif m.group("value"):
+                self.assignments.append((m.group("name").lower(), m.group("value")))
+                self.numbers.append(m.group("value").lstrip("-"))
+            elif m.group("name"):
+                self.calls.append((m.group("name").lower(), m.group("args")))
+            elif m.group("number"):
+                self.numbers.append(m.group("number"))
+        pieces.append(code[last:])
+        self.text = "".join(pieces)
+        self.lower = self.text.lower()
+
+    def first_array(self, min_len: int = 0) -> Optional[List[int]]:
+        return next((arr for arr in self.arrays if len(arr) >= min_len), None)
+
+    def call_args(self, *names: str, count: int = 1, signed: bool = False):
+        """Integer arguments of each call to one of `names` taking exactly `count` of them."""
+        for name, args in self.calls:
+            if name in names:
+                values = _ints(args, signed)
+                if values is not None and len(values) == count:
+                    yield values
+
+    def assigned(self, *names: str, signed: bool = False) -> Optional[int]:
+        """Value of the first `name = <int>` (or `name: <int>`) for one of `names`."""
+        for name, value in self.assignments:
+            if name in names and (signed or not value.startswith("-")):
+                return int(value)
+        return None
+
+
+def _ints(args: str, signed: bool) -> Optional[List[int]]:
+    if not args:
+        return []
+    values = [a.strip() for a in args.split(",")]
+    if all(INT_RE.fullmatch(v) and (signed or not v.startswith("-")) for v in values):
+        return [int(v) for v in values]
+    return None
+
+
+def parse_code_for_visualizer(algorithm: str, code: str, default_input: Any):
+    """Attempt to extract logic/data from user code for the simulator."""
+    if not code or not code.strip():
+        return default_input
+    entry = ve.get(algorithm)
+    if entry is None or entry.parser is None:
+        return default_input
+    return entry.parser(CodeSummary(code), default_input)
+
+
+@ve.parser("stack")
+def parse_stack(code: CodeSummary, default_input: Any):
+    ops = []
+    # Support push(10), stack.push(20), s.add(30)
+    for name, val in code.calls:
+        if name in ("push", "add"):
+            ops.append({"action": "push", "value": val or "X"})
+        elif name in ("pop", "remove"):
+            ops.append({"action": "pop", "value": None})
+    return ops or default_input
+
+
+@ve.parser("queue")
+def parse_queue(code: CodeSummary, default_input: Any):
+    ops = []
+    for name, val in code.calls:
+        if name in ("enqueue", "add", "offer"):
+            ops.append({"action": "enqueue", "value": val or "X"})
+        elif name in ("dequeue", "remove", "poll"):
+            ops.append({"action": "dequeue", "value": None})
+    if not ops:
+        return default_input
+    # new MyCircularQueue(5) or capacity = 5 picks the circular buffer
+    args = next(code.call_args("mycircularqueue", "circularqueue"), None)
+    capacity = args[0] if args else code.assigned("capacity")
+    if capacity:
+        capacity = min(capacity, ve.queue_capacity_limit(ops))
+    return {"ops": ops, "capacity": capacity} if capacity else ops
+
+
+@ve.parser("bubble_sort", "insertion_sort")
+def parse_sort(code: CodeSummary, default_input: Any):
+    # At least 2 elements to count as data, which skips `new int[5]` and the like
+    nums = code.first_array(min_len=2)
+    return nums if nums is not None else default_input
+
+
+@ve.parser("binary_search")
+def parse_binary_search(code: CodeSummary, default_input: Any):
+    nums = code.first_array(min_len=2)
+    if nums is None:
+        return default_input
+    # Fallback to search for 'target = X' or similar, else the last element
+    target = code.assigned("target", "find", "search", "val", signed=True)
+    return {"arr": sorted(nums), "target": nums[-1] if target is None else target}
+
+
+@ve.parser("arrays")
+def parse_arrays(code: CodeSummary, default_input: Any):
+    # Support arr[idx] = val, arr[idx] and search(val)
+    ops = [{"action": "update", "index": i, "value": v} for i, v, _ in code.indexes if v is not None]
+    ops += [{"action": "access", "index": i} for i, v, compared in code.indexes if v is None and not compared]
+    search = next(code.call_args("search", signed=True), None)
+    if search:
+        ops.append({"action": "search", "value": search[0]})
+    arr = code.first_array()
+    return {"arr": arr if arr is not None else [1, 2, 3, 4, 5], "ops": ops or [{"action": "access", "index": 0}]}
+
+
+@ve.parser("strings")
+def parse_strings(code: CodeSummary, default_input: Any):
+    action = "palindrome" if "palindrome" in code.lower else "reverse"
+    s = code.strings[0] if code.strings else "radar"
+    return {"s": s, "action": action}
+
+
+@ve.parser("hashing")
+def parse_hashing(code: CodeSummary, default_input: Any):
+    keys = [int(x) for x in code.numbers if len(x) < 5][:10] if code.numbers else [10, 20, 30]
+    return {"keys": keys, "size": 7}
+
+
+@ve.parser("heap")
+def parse_heap(code: CodeSummary, default_input: Any):
+    action = "extract"
+    val = None
+    if "insert" in code.lower or "add" in code.lower:
+        action = "insert"
+        args = next(code.call_args("insert", "add"), None)
+        val = args[0] if args else 50
+    arr = code.first_array()
+    return {"arr": arr if arr is not None else [10, 20, 30], "action": action, "val": val}
+
+
+@ve.parser("backtracking")
+def parse_backtracking(code: CodeSummary, default_input: Any):
+    n = int(code.numbers[0]) if code.numbers else 10
+    return n if n < 10 else 4
+
+
+@ve.parser("linked_lists")
+def parse_linked_list(code: CodeSummary, default_input: Any):
+    action = "insert"
+    val, pos = 10, 0
+    if "delete" in code.lower or "remove" in code.lower:
+        action = "delete"
+        args = next(code.call_args("delete", "remove"), None)
+        pos = args[0] if args else 0
+    else:
+        args = next(code.call_args("insert", "add", count=2), None)
+        if args: val, pos = args
+    arr = code.first_array()
+    return {"arr": arr if arr is not None else [1, 2, 3], "action": action, "val": val, "pos": pos}
+
+
+@ve.parser("greedy_algorithms")
+def parse_greedy(code: CodeSummary, default_input: Any):
+    amount = code.assigned("amount", "val", "n")
+    coins = code.first_array()
+    return {"amount": 55 if amount is None else amount, "coins": coins if coins is not None else [10, 5, 1]}
+
+
+@ve.parser("dynamic_programming")
+def parse_dp(code: CodeSummary, default_input: Any):
+    args = next(code.call_args("fib", "fibonacci", "dp"), None)
+    n = min(args[0], ve.DP_MAX_N) if args else 6
+    if "memo" in code.lower or "cache" in code.lower:
+        return {"n": n, "mode": "memo"}
+    if "dp[" in code.lower or "table" in code.lower:
+        return {"n": n, "mode": "tabulation"}
+    return n
+
+
+@ve.parser("bit_manipulation")
+def parse_bit_manipulation(code: CodeSummary, default_input: Any):
+    op = "AND"
+    if "OR" in code.text: op = "OR"
+    elif "XOR" in code.text: op = "XOR"
+    elif "LSHIFT" in code.text or "<<" in code.text: op = "SHIFT"
+    val = code.assigned("val", "n", "a")
+    mask = code.assigned("mask", "b", "m")
+    return {"val": 15 if val is None else val, "op": op, "mask": 1 if mask is None else mask}
+
+
+@ve.parser("tries")
+def parse_tries(code: CodeSummary, default_input: Any):
+    return code.strings or ["code", "cool"]
+
+
+@ve.parser("segment_trees")
+def parse_segment_tree(code: CodeSummary, default_input: Any):
+    arr = code.first_array()
+    return arr if arr is not None else [1, 2, 3, 4]
+
+
+@ve.parser("disjoint_set_union")
+def parse_dsu(code: CodeSummary, default_input: Any):
+    args = next(code.call_args("dsu"), None)  # new DSU(n)
+    n = args[0] if args else 5
+    ops = [("union", u, v) for u, v in code.call_args("union", count=2)]
+    ops += [("find", u, None) for u, in code.call_args("find")]
+    data = {"n": n, "ops": ops or [("union", 0, 1)]}
+    compact = "".join(code.lower.split())
+    if "parent[parent[" in compact:
+        data["find"] = "halving"
+    elif "=find(" in compact:
+        data["find"] = "compression"
+    if "rank" in compact:
+        data["union"] = "rank"
+    elif "size" in compact:
+        data["union"] = "size"
+    return data
+
+
+@ve.parser("factorial")
+def parse_factorial(code: CodeSummary, default_input: Any):
+    args = next(code.call_args("fact", "factorial"), None)
+    return args[0] if args else default_input
@@ -0,0 +1,243 @@
+import re
+from collections import defaultdict
+
+SUPERSCRIPTS = str.maketrans({"²": "^2", "³": "^3", "×": "*", "·": "*", "√": "sqrt "})
+BIG_O_RE = re.compile(r"O\(")
+TOKEN_RE = re.compile(r"[A-Za-z_α]+|\d+(?:\.\d+)?|\S")
+# Graph sizes are written upper-case by convention; other variables are folded to lower.
+GRAPH_VARS = frozenset("VEve")
+# A leading coefficient, written with `*` or juxtaposed ("4N", "32n"), or a
+# trailing one ("n/2", "n * 10").
+CONSTANT_FACTOR_RE = re.compile(r"^\d+(?:\.\d+)?(?: \*)? (?=[A-Za-z_α(\d])|( \* |/)\d+(?:\.\d+)?$")
+# "nlogn", "nlog n", "logk": log run together with single-letter variables.
+JOINED_LOG_RE = re.compile(r"\b([A-Za-z]?)log([A-Za-z]?)\b")
+# log(n) and sqrt(n) around a single name or number read as log n, sqrt n.
+UNWRAP_RE = re.compile(r"\b(log|sqrt)\(\s*([A-Za-z_]\w*|\d+)\s*\)")
+# "VE": the product of the graph sizes, run together.
+GRAPH_PRODUCT_RE = re.compile(r"\b([VE])([VE])\b")
+# Names a query may use besides single-letter variables and the index's own.
+FUNCTIONS = frozenset({"log", "sqrt", "α", "min", "max"})
+# Functions written before a bare argument: "log n", "log^2 n", "log_k n", "sqrt n".
+PREFIX_FUNCTION_RE = re.compile(r"(?:log|sqrt)(?:[\^_]\S+)?")
+# A factor that reads as maths rather than words: a single-letter variable,
+# a number, a bracketed group or a call, possibly raised, indexed or
+# divided ("n^2", "2^n", "n!", "n/p", "α(n)").
+MATH_FACTOR_RE = re.compile(r"(?:[A-Za-zα]|\d+(?:\.\d+)?|[A-Za-z_α]\w*\(.*\)|\(.*\))(?:[\^_/!].*)?")
+
+
+def _big_o_spans(text: str):
+    """Yield the inside of every balanced O(...) in `text`."""
+    for m in BIG_O_RE.finditer(text):
+        depth = 1
+        i = m.end()
+        while i < len(text) and depth:
+            if text[i] == "(":
+                depth += 1
+            elif text[i] == ")":
+                depth -= 1
+            i += 1
+        if depth == 0:
+            yield text[m.end():i - 1]
+
+
+def _split_log(m) -> str:
+    return " ".join(part for part in (m.group(1), "log", m.group(2)) if part)
+
+
+def _split_top(expr: str, sep: str):
+    """Split `expr` at each `sep` outside brackets."""
+    parts = []
+    depth = start = i = 0
+    while i < len(expr):
+        ch = expr[i]
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        elif not depth and expr.startswith(sep, i):
+            parts.append(expr[start:i])
+            i = start = i + len(sep)
+            continue
+        i += 1
+    parts.append(expr[start:])
+    return parts
+
+
+def _inside(factor: str) -> str:
+    """`factor` with what's inside each of its brackets put in canonical order."""
+    out = []
+    depth = start = 0
+    for i, ch in enumerate(factor):
+        if ch == "(":
+            if not depth:
+                out.append(factor[start:i + 1])
+                start = i + 1
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if not depth:
+                out.append(", ".join(_sum(arg) for arg in _split_top(factor[start:i], ", ")))
+                start = i
+    out.append(factor[start:])
+    return "".join(out)
+
+
+def _factors(part: str):
+    """The juxtaposed factors of `part` ("n log n" -> n, log n). Words that
+    aren't maths ("number of bits") stay together as one factor."""
+    factors = []
+    pending = []  # prefix functions waiting for their argument
+    for piece in _split_top(part, " "):
+        if PREFIX_FUNCTION_RE.fullmatch(piece):
+            pending.append(piece)
+            continue
+        factors.append(" ".join(pending + [piece]))
+        if not pending and not MATH_FACTOR_RE.fullmatch(piece):
+            return [part]
+        pending = []
+    if pending:
+        factors.append(" ".join(pending))
+    return factors
+
+
+def _factor_order(factor: str):
+    # Variables and numbers first, then functions and bracketed groups.
+    call = PREFIX_FUNCTION_RE.fullmatch(factor.split(" ", 1)[0]) or re.match(r"[A-Za-z_α]\w*\(|\(", factor)
+    return bool(call), factor.lower(), factor
+
+
+def _product(term: str) -> str:
+    factors = [_inside(f) for part in _split_top(term, " * ") for f in _factors(part)]
+    return " ".join(sorted(factors, key=_factor_order))
+
+
+def _sum(expr: str) -> str:
+    """`expr` with `*` dropped and the factors and terms of its products and
+    sums sorted, so O(m * n) and O(n m), or O(V + E) and O(E + V), agree."""
+    return " + ".join(sorted(map(_product, _split_top(expr, " + ")), key=lambda term: (term.lower(), term)))
+
+
+def _names(cls: str):
+    """Every name (variable or function) in a canonical class."""
+    return {tok for tok in TOKEN_RE.findall(cls[2:-1]) if tok[0].isalpha() or tok[0] in "_α"}
+
+
+def _normalize(expr: str):
+    expr = expr.translate(SUPERSCRIPTS).replace("alpha", "α")
+    expr = JOINED_LOG_RE.sub(_split_log, expr)
+    expr = UNWRAP_RE.sub(r"\1 \2", expr)
+    expr = GRAPH_PRODUCT_RE.sub(r"\1 \2", expr)
+    tokens = TOKEN_RE.findall(expr)
+    out = []
+    prev = ""
+    for i, tok in enumerate(tokens):
+        word = tok[0].isalnum() or tok[0] in "_α"
+        calls = i + 1 < len(tokens) and tokens[i + 1] == "("
+        if word and len(tok) == 1 and tok.isalpha() and not calls:
+            tok = tok.upper() if tok in GRAPH_VARS else tok.lower()
+        if tok in "+*":
+            out.append(f" {tok} ")
+        elif tok == ",":
+            out.append(", ")
+        elif word and (prev[:1].isalnum() or prev[:1] in "_α" or prev == ")"):
+            out.append(" " + tok)
+        else:
+            out.append(tok)
+        prev = tok
+    inner = "".join(out).strip()
+    if re.fullmatch(r"[\d.^+* /()]+", inner):
+        return "1"
+    inner = _sum(inner)
+    # Constant factors don't change the class: O(32 * n) and O(n/2) are O(n).
+    previous = None
+    while previous != inner:
+        previous, inner = inner, CONSTANT_FACTOR_RE.sub("", inner)
+    return inner or None
+
+
+def canonical(text: str):
+    """Canonical class of the first O(...) in `text`, e.g. 'O(n²) worst' -> 'O(n^2)'."""
+    for cls in _all_classes(text):
+        return cls
+    return None
+
+
+def _all_classes(text: str):
+    for inner in _big_o_spans(text):
+        norm = _normalize(inner)
+        if norm:
+            yield f"O({norm})"
+
+
+def parse_query(value: str, known=frozenset()):
+    """Canonicalize a user-supplied class; bare 'n log n' is read as O(n log n).
+
+    Returns None unless every name in it is a single-letter variable, one of
+    FUNCTIONS or in `known` (the names an index files classes under), so
+    free text isn't mistaken for a class.
+    """
+    value = value.strip()
+    if value[:2] in ("Ω(", "Θ(", "ω(", "θ("):
+        return None  # only upper bounds are indexed
+    if not value.startswith("O("):
+        value = f"O({value})"
+    cls = canonical(value)
+    if cls is None or any(len(name) > 1 and name not in FUNCTIONS and name not in known for name in _names(cls)):
+        return None
+    return cls
+
+
+class ComplexityIndex:
+    """Inverted index from canonical complexity class to curriculum entries.
+
+    A time value is filed under its leading class ("O(1) avg, O(n) worst" is
+    O(1)). Space strings often compare variants ("O(1) for Heap Sort; O(k)
+    for ..."), so an entry is filed under every class its space string names.
+    """
+
+    def __init__(self, content):
+        self.time = defaultdict(list)   # class -> [(module, level, operation, raw)]
+        self.space = defaultdict(set)   # class -> {(module, level)}
+        self.space_raw = {}             # (module, level) -> raw space string
+        self.symbols = set()            # every name used by an indexed class
+        for module in content:
+            for level in content[module]:
+                entry = content[module][level]
+                for op, raw in entry["time_complexity"].items():
+                    cls = canonical(raw)
+                    if cls:
+                        self.time[cls].append((module, level, op, raw))
+                self.space_raw[(module, level)] = entry["space_complexity"]
+                for cls in set(_all_classes(entry["space_complexity"])):
+                    self.space[cls].add((module, level))
+        for cls in (*self.time, *self.space):
+            self.symbols |= _names(cls)
+
+    def classes(self):
+        return {
+            "time": {cls: len(hits) for cls, hits in sorted(self.time.items(), key=lambda kv: -len(kv[1]))},
+            "space": {cls: len(hits) for cls, hits in sorted(self.space.items(), key=lambda kv: -len(kv[1]))},
+        }
+
+    def query(self, time: str = None, space: str = None):
+        entries = self.space.get(space, set()) if space else None
+        matches = []
+        if time:
+            for module, level, op, raw in self.time.get(time, ()):
+                if entries is None or (module, level) in entries:
+                    matches.append({
+                        "module": module, "level": level, "operation": op,
+                        "time": raw, "space": self.space_raw[(module, level)],
+                    })
+        elif entries is not None:
+            for module, level in sorted(entries):
+                matches.append({
+                    "module": module, "level": level, "operation": None,
+                    "time": None, "space": self.space_raw[(module, level)],
+                })
+        return matches
+
+
+def get_index(content) -> ComplexityIndex:
+    """The complexity index over `content`, built on first use (see ContentStore.derived)."""
+    return content.derived(ComplexityIndex)
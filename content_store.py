@@ -0,0 +1,268 @@
+import json
+import mmap
+import os
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from response_cache import EncodedBody, dumps
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "content")
+
+# Field projections kept per entry, least recently used dropped first.
+PROJECTION_CACHE_SIZE = 8
+
+# Every level entry carries these keys, in this order.
+CONTENT_FIELDS = (
+    "definition", "working", "algorithm", "time_complexity", "space_complexity",
+    "applications", "advantages", "disadvantages", "interview_notes", "java",
+)
+
+
+class ContentStore(Mapping):
+    """Read-only view of the curriculum backed by memory-mapped per-module files.
+
+    Only the small offset index is read at startup. A level entry is sliced
+    out of its module's mmap the first time it is requested and cached from
+    then on, so a worker that serves a handful of modules never decodes the
+    rest.
+    """
+
+    def __init__(self, directory: str = CONTENT_DIR):
+        self.directory = directory
+        with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+            self._index = json.load(f)["modules"]
+        self._modules = {name: ModuleContent(self, name, info["levels"]) for name, info in self._index.items()}
+        self._maps = {}
+        self._entries = {}
+        self._all = None
+        self._derived = {}
+        self._lock = threading.Lock()
+        self._derived_lock = threading.Lock()
+
+    def __getitem__(self, module):
+        return self._modules[module]
+
+    def __iter__(self):
+        return iter(self._modules)
+
+    def __len__(self):
+        return len(self._modules)
+
+    def _map(self, module: str) -> mmap.mmap:
+        mapped = self._maps.get(module)
+        if mapped is None:
+            with self._lock:
+                mapped = self._maps.get(module)
+                if mapped is None:
+                    path = os.path.join(self.directory, self._index[module]["file"])
+                    with open(path, "rb") as f:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    self._maps[module] = mapped
+        return mapped
+
+    def has(self, module: str, level: str) -> bool:
+        return level in self._index.get(module, {}).get("levels", {})
+
+    def raw(self, module: str, level: str) -> bytes:
+        """Serialized JSON for one entry, exactly as served."""
+        offset, length = self._index[module]["levels"][level]
+        return self._map(module)[offset:offset + length]
+
+    def entry(self, module: str, level: str) -> "ContentEntry":
+        key = (module, level)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries.setdefault(key, ContentEntry(module, level, self.raw(module, level)))
+        return entry
+
+    def encoded(self, module: str, level: str):
+        """Pre-compressed response body for an entry, or None if it doesn't exist."""
+        if not self.has(module, level):
+            return None
+        return self.entry(module, level).encoded
+
+    def projection(self, module: str, level: str, fields: tuple):
+        """Encoded body holding only `fields` of an entry, or None if it doesn't exist."""
+        if not self.has(module, level):
+            return None
+        return self.entry(module, level).projection(fields)
+
+    def ndjson_line(self, module: str, level: str, fields: tuple = ()) -> bytes:
+        """One bulk-response line wrapping the pre-encoded entry (or projection)."""
+        head = b'{"module":' + dumps(module) + b',"level":' + dumps(level)
+        if not self.has(module, level):
+            error = dumps(f"Content not found for module='{module}' level='{level}'")
+            return head + b',"error":' + error + b"}\n"
+        entry = self.entry(module, level)
+        body = entry.projection(fields).identity if fields else entry.raw
+        return head + b',"content":' + body + b"}\n"
+
+    def all_ndjson(self) -> EncodedBody:
+        """Every entry as newline-delimited JSON, encoded once."""
+        if self._all is None:
+            self._all = EncodedBody(b"".join(
+                self.ndjson_line(module, level)
+                for module, levels in self._modules.items()
+                for level in levels
+            ))
+        return self._all
+
+    def derived(self, build):
+        """`build(self)`, computed once per store: indexes over the content
+        live with the store they were built from."""
+        value = self._derived.get(build)
+        if value is None:
+            with self._derived_lock:
+                value = self._derived.get(build)
+                if value is None:
+                    value = self._derived[build] = build(self)
+        return value
+
+    def warm(self):
+        """Load and encode every entry up front (e.g. before forking workers)."""
+        for module, levels in self._modules.items():
+            for level in levels:
+                self.entry(module, level).encoded
+
+
+_projection_lock = threading.Lock()
+
+
+class ContentEntry(Mapping):
+    """One level of one module as a fixed-shape, slotted record.
+
+    Fields are attributes rather than keys of a per-entry dict, the
+    operation names in time_complexity are interned (they repeat across
+    entries), and the served JSON bytes, their compressed variants and any
+    field projections live on the record itself.
+    """
+
+    __slots__ = CONTENT_FIELDS + ("module", "level", "raw", "_encoded", "_projections")
+
+    def __init__(self, module: str, level: str, raw: bytes):
+        data = json.loads(raw)
+        data["time_complexity"] = {sys.intern(op): cost for op, cost in data["time_complexity"].items()}
+        for field in CONTENT_FIELDS:
+            setattr(self, field, data[field])
+        self.module = sys.intern(module)
+        self.level = sys.intern(level)
+        self.raw = raw
+        self._encoded = None
+        self._projections = None
+
+    def __getitem__(self, field):
+        if field not in CONTENT_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self):
+        return iter(CONTENT_FIELDS)
+
+    def __len__(self):
+        return len(CONTENT_FIELDS)
+
+    @property
+    def encoded(self) -> EncodedBody:
+        """Identity/gzip/brotli bodies for the whole entry, built on first use."""
+        if self._encoded is None:
+            self._encoded = EncodedBody(self.raw)
+        return self._encoded
+
+    def projection(self, fields: tuple) -> EncodedBody:
+        """Encoded body holding only `fields`, cached per field set.
+
+        `fields` must already be canonical (a subset of CONTENT_FIELDS in
+        that order) so equivalent requests share one cache slot. Any of the
+        ~1000 field sets can be asked for, so only the PROJECTION_CACHE_SIZE
+        most recent are kept, compressed at fast levels.
+        """
+        with _projection_lock:
+            if self._projections is None:
+                self._projections = OrderedDict()
+            encoded = self._projections.get(fields)
+            if encoded is not None:
+                self._projections.move_to_end(fields)
+                return encoded
+        projected = {field: getattr(self, field) for field in fields}
+        encoded = EncodedBody.from_payload(projected, best=False)
+        with _projection_lock:
+            self._projections[fields] = encoded
+            if len(self._projections) > PROJECTION_CACHE_SIZE:
+                self._projections.popitem(last=False)
+        return encoded
+
+
+def parse_fields(fields: str):
+    """Split a ?fields= value into canonical order; returns (fields, unknown)."""
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = sorted(requested.difference(CONTENT_FIELDS))
+    return tuple(f for f in CONTENT_FIELDS if f in requested), unknown
+
+
+class ModuleContent(Mapping):
+    """Level -> entry mapping for one module; entries load on first access."""
+
+    def __init__(self, store: ContentStore, module: str, levels: dict):
+        self._store = store
+        self._module = module
+        self._levels = levels
+
+    def __getitem__(self, level):
+        if level not in self._levels:
+            raise KeyError(level)
+        return self._store.entry(self._module, level)
+
+    def __iter__(self):
+        return iter(self._levels)
+
+    def __len__(self):
+        return len(self._levels)
+
+
+def _deep_size(obj, seen) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_size(v, seen) for v in obj)
+    elif isinstance(obj, ContentEntry):
+        size += sum(_deep_size(getattr(obj, f), seen) for f in CONTENT_FIELDS + ("module", "level"))
+    return size
+
+
+def memory_report(store: "ContentStore" = None) -> dict:
+    """Compare resident size of the slotted entries with the old dict-of-dicts.
+
+    The dict-of-dicts side is rebuilt the way the inline literal used to
+    exist: one freshly decoded dict per entry. Served JSON bytes are listed
+    separately since both layouts keep them once encoded.
+    """
+    store = store or DSA_CONTENT
+    entries = [store.entry(m, l) for m in store for l in store[m]]
+    nested = {}
+    for e in entries:
+        nested.setdefault(e.module, {})[e.level] = json.loads(e.raw)
+
+    seen = set()
+    records = sum(_deep_size(e, seen) for e in entries)
+    dicts = _deep_size(nested, set())
+    return {
+        "entries": len(entries),
+        "dict_of_dicts_bytes": dicts,
+        "content_entry_bytes": records,
+        "saved_bytes": dicts - records,
+        "encoded_json_bytes": sum(len(e.raw) for e in entries),
+    }
+
+
+DSA_CONTENT = ContentStore()
+
+
+if __name__ == "__main__":
+    for key, value in memory_report().items():
+        print(f"{key}: {value}")
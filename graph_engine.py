@@ -0,0 +1,255 @@
+"""Graph traversal simulators.
+
+Registered lazily from visualizer_engine (see register_lazy), so this module
+is only imported the first time a graph algorithm is visualized.
+
+The input graph is converted once to a compact integer form: nodes are
+numbered in the order they first appear (the start node is 0) and edges are
+kept in CSR layout, so a traversal touches each node and edge a constant
+number of times. Steps are emitted as delta frames whose lists only grow at
+the end, keeping a whole trace linear in the size of the graph.
+"""
+from array import array
+from collections import deque
+from itertools import accumulate, chain
+from typing import Any, Dict, Iterable, List
+
+import trace_codec
+
+# Longest list of nodes spelled out in a single explanation.
+EXPLAIN_LIMIT = 10
+
+
+class Graph:
+    """A directed graph in CSR form: the neighbours of node `u` are
+    `targets[offsets[u]:offsets[u + 1]]`. `labels[u]` is the node's name.
+
+    Built from adjacency lists and/or an edge list ([u, v] pairs); with
+    `directed` false every edge is added both ways.
+    """
+
+    __slots__ = ("labels", "offsets", "targets")
+
+    def __init__(self, start: Any, adj: Dict[Any, List[Any]] = None, edges: Iterable[List[Any]] = (),
+                 directed: bool = True):
+        index: Dict[str, int] = {}
+        labels: List[str] = []
+        rows: List[List[int]] = []  # neighbours of each node, in input order
+
+        def node(label) -> int:
+            label = str(label)
+            i = index.get(label)
+            if i is None:
+                i = index[label] = len(labels)
+                labels.append(label)
+                rows.append([])
+            return i
+
+        node(start)
+        for u, neighbors in (adj or {}).items():
+            rows[node(u)].extend(map(node, neighbors))
+        for edge in edges:
+            rows[node(edge[0])].append(node(edge[1]))
+        if not directed:
+            forward = [len(row) for row in rows]
+            for u, row in enumerate(rows):
+                for v in row[:forward[u]]:
+                    rows[v].append(u)
+
+        self.labels = labels
+        self.offsets = array("l", accumulate(map(len, rows), initial=0))
+        self.targets = array("l", chain.from_iterable(rows))
+
+    def __len__(self):
+        return len(self.labels)
+
+    def neighbors(self, u: int):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+
+def _names(labels: List[str]) -> str:
+    if len(labels) <= EXPLAIN_LIMIT:
+        return ", ".join(labels)
+    return f"{', '.join(labels[:EXPLAIN_LIMIT])} and {len(labels) - EXPLAIN_LIMIT} more"
+
+
+def simulate_bfs(adj: Dict[Any, List[Any]], start: Any, granularity: str = "node",
+                 edges: Iterable[List[Any]] = (), directed: bool = True):
+    """Breadth-first search from `start`.
+
+    `array` is the visited order, which for BFS also holds the queue: it is
+    `array[front:rear + 1]`, so a step only appends what it discovered and
+    moves the pointers. With granularity "node" there is a step per dequeued
+    node; with "level" a step per BFS level, for graphs too big to watch
+    node by node.
+    """
+    if granularity not in ("node", "level"):
+        raise ValueError("granularity must be 'node' or 'level'")
+    graph = Graph(start, adj, edges, directed)
+    labels = graph.labels
+    level = [-1] * len(graph)
+    level[0] = 0
+    order = [labels[0]]
+    queue = deque([0])
+    framer = trace_codec.Framer()
+
+    yield framer.frame({
+        "line": 1,
+        "variables": {"current": None, "level": 0, "queue_size": 1, "visited_count": 1},
+        "array": order,
+        "pointers": {"front": 0, "rear": 0},
+        "explanation": f"Starting BFS from {labels[0]}"
+    })
+
+    front = 0
+    while queue:
+        depth = level[queue[0]]
+        added = len(order)
+        # Between levels the queue holds exactly the next level
+        expanded = 1 if granularity == "node" else len(queue)
+        for _ in range(expanded):
+            curr = queue.popleft()
+            front += 1
+            for v in graph.neighbors(curr):
+                if level[v] < 0:
+                    level[v] = depth + 1
+                    order.append(labels[v])
+                    queue.append(v)
+        discovered = order[added:]
+
+        if granularity == "node":
+            variables = {"current": labels[curr], "level": depth}
+            pointers = {"current": front - 1}
+            explanation = f"Dequeued {labels[curr]} (level {depth})"
+        else:
+            variables = {"level": depth, "expanded": expanded}
+            pointers = {}
+            explanation = f"Level {depth}: expanded {expanded} node{'s' if expanded != 1 else ''}"
+        explanation += f", discovered {_names(discovered)}" if discovered else ", no new nodes"
+        variables.update(queue_size=len(queue), visited_count=len(order))
+        pointers.update(front=front, rear=len(order) - 1)
+        yield framer.frame({
+            "line": 5,
+            "variables": variables,
+            "array": order,
+            "pointers": pointers,
+            "explanation": explanation
+        }, array=trace_codec.appended(added, discovered))
+
+    levels = max(level) + 1
+    yield framer.frame({
+        "line": 10,
+        "variables": {"visited_count": len(order), "levels": levels},
+        "array": order,
+        "pointers": {},
+        "explanation": f"BFS complete! Visited {len(order)} nodes over {levels} level{'s' if levels != 1 else ''}"
+    })
+
+
+def _stack_change(stack: List[Any], low: int, sent: int):
+    """List change for a stack that was `sent` long at the last frame and
+    has been down to `low` items since."""
+    if low == sent == len(stack):
+        return None
+    change = {}
+    if low < sent:
+        change["len"] = low
+    if len(stack) > low:
+        change.update(trace_codec.appended(low, stack[low:]))
+    return change
+
+
+def simulate_dfs(adj: Dict[Any, List[Any]], start: Any, events: str = "both",
+                 edges: Iterable[List[Any]] = (), directed: bool = True):
+    """Depth-first search from `start`, with discovery and finish times.
+
+    Runs iteratively: `stack` is the explicit DFS stack (the path from the
+    start to the current node) and `array` the discovery order. `events`
+    picks the event stream: a step when each node is discovered ("pre"),
+    when it finishes ("post"), or both. Steps in between are folded into
+    the next frame's stack change, so the trace stays linear either way.
+    """
+    if events not in ("both", "pre", "post"):
+        raise ValueError("events must be 'both', 'pre' or 'post'")
+    graph = Graph(start, adj, edges, directed)
+    labels, offsets, targets = graph.labels, graph.offsets, graph.targets
+    discovery = [-1] * len(graph)
+    finish = [-1] * len(graph)
+    position = [-1] * len(graph)  # index in the discovery order
+    order = []
+    path = []       # labels on the stack, shown as `stack`
+    nodes = []      # node ids on the stack
+    next_edge = []  # per stack entry, the next edge to look at
+    framer = trace_codec.Framer()
+    time = 0
+    sent_order = sent_path = low = 0  # list lengths at the last frame, shortest stack since
+
+    def enter(u: int):
+        nonlocal time
+        discovery[u] = time
+        time += 1
+        position[u] = len(order)
+        order.append(labels[u])
+        path.append(labels[u])
+        nodes.append(u)
+        next_edge.append(offsets[u])
+
+    def frame(step: Dict[str, Any]):
+        nonlocal sent_order, sent_path, low
+        step.update(array=order, stack=path)
+        out = framer.frame(step, array=trace_codec.appended(sent_order, order[sent_order:]),
+                           stack=_stack_change(path, low, sent_path))
+        sent_order, sent_path, low = len(order), len(path), len(path)
+        return out
+
+    def event(u: int, name: str, line: int, explanation: str):
+        return frame({
+            "line": line,
+            "variables": {"current": labels[u], "event": name, "time": time - 1, "depth": len(path),
+                          "discovery": discovery[u], "finish": finish[u] if finish[u] >= 0 else None},
+            "pointers": {"current": position[u]},
+            "explanation": explanation
+        })
+
+    yield frame({
+        "line": 1,
+        "variables": {"current": None, "time": 0},
+        "pointers": {"start": 0},
+        "explanation": f"Starting DFS from {labels[0]}"
+    })
+    enter(0)
+    if events != "post":
+        yield event(0, "discover", 5, f"Discovered {labels[0]} at time 0")
+
+    while nodes:
+        u = nodes[-1]
+        k, end = next_edge[-1], offsets[u + 1]
+        while k < end and discovery[targets[k]] >= 0:
+            k += 1
+        if k < end:
+            next_edge[-1] = k + 1
+            v = targets[k]
+            enter(v)
+            if events != "post":
+                yield event(v, "discover", 5, f"Discovered {labels[v]} at time {discovery[v]} from {labels[u]}")
+            continue
+        # Every neighbour seen: u finishes and comes off the stack
+        finish[u] = time
+        time += 1
+        nodes.pop()
+        next_edge.pop()
+        path.pop()
+        low = min(low, len(path))
+        if events != "pre":
+            explanation = f"Finished {labels[u]} at time {finish[u]}"
+            explanation += f", backtracking to {path[-1]}" if path else ", stack is empty"
+            yield event(u, "finish", 8, explanation)
+
+    yield frame({
+        "line": 10,
+        "variables": {"visited_count": len(order), "time": time,
+                      "discovery_times": {labels[v]: discovery[v] for v in range(len(graph)) if discovery[v] >= 0},
+                      "finish_times": {labels[v]: finish[v] for v in range(len(graph)) if finish[v] >= 0}},
+        "pointers": {},
+        "explanation": f"DFS complete! Visited {len(order)} nodes"
+    })
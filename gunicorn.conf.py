@@ -0,0 +1,41 @@
+"""Pre-fork serving: gunicorn -c gunicorn.conf.py main:app
+
+The master imports main once, builds every content cache and index, then
+freezes the GC so those objects sit in the permanent generation. Workers
+forked afterwards share the pages copy-on-write instead of dirtying them
+with GC bookkeeping, so memory stays close to one process's worth no
+matter how many workers run.
+
+Each worker then starts its own simulation process pool (see
+simulation.py); pools can't be shared across a fork, so this happens after
+the worker is forked rather than in the master. The worker count is passed
+on so those pools divide the host's CPUs between them rather than each
+sizing itself for the whole machine.
+"""
+import gc
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+os.environ.setdefault("VISUALIZE_SERVER_WORKERS", str(workers))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Keep collections from touching (and un-sharing) objects until they are frozen.
+gc.disable()
+
+
+def when_ready(server):
+    import main
+
+    main.warm_caches()
+    gc.freeze()
+    gc.enable()
+    server.log.info("Warmed content caches; %d objects frozen for workers", gc.get_freeze_count())
+
+
+def post_worker_init(worker):
+    import simulation
+
+    simulation.warm_pool()
@@ -0,0 +1,94 @@
+import gzip
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response
+
+from serialize import dumps
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip/identity still work without it
+    brotli = None
+
+
+class EncodedBody:
+    """One JSON payload encoded once into identity, gzip and brotli bytes.
+
+    Compression is at the highest levels by default, which pays off for
+    bodies that are built once and served for the life of the process;
+    `best=False` uses fast levels for bodies built on demand.
+    """
+
+    __slots__ = ("identity", "gzip", "br", "digest")
+
+    def __init__(self, identity: bytes, best: bool = True):
+        self.identity = identity
+        self.digest = hashlib.sha256(identity).hexdigest()[:32]
+        self.gzip = _smaller(gzip.compress(identity, compresslevel=9 if best else 6, mtime=0), identity)
+        self.br = _smaller(brotli.compress(identity, quality=11 if best else 5), identity) if brotli else None
+
+    @classmethod
+    def from_payload(cls, payload: Any, best: bool = True) -> "EncodedBody":
+        return cls(dumps(payload), best)
+
+    def pick(self, accept_encoding: str):
+        """Return (body, content-encoding or None) for an Accept-Encoding header."""
+        accepted = _parse_accept_encoding(accept_encoding)
+        if self.br is not None and "br" in accepted:
+            return self.br, "br"
+        if self.gzip is not None and "gzip" in accepted:
+            return self.gzip, "gzip"
+        return self.identity, None
+
+    def etag(self, encoding=None) -> str:
+        # Strong validators must differ per content-coding, so compressed
+        # variants carry a suffix on top of the shared content hash.
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def matches(self, if_none_match: str) -> bool:
+        """True if an If-None-Match header already names this content."""
+        for tag in (if_none_match or "").split(","):
+            tag = tag.strip()
+            if tag == "*":
+                return True
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            tag = tag.strip('"')
+            if tag.split("-", 1)[0] == self.digest:
+                return True
+        return False
+
+    def response(self, request: Request, media_type: str = "application/json") -> Response:
+        body, encoding = self.pick(request.headers.get("accept-encoding", ""))
+        headers = {"Vary": "Accept-Encoding", "ETag": self.etag(encoding)}
+        if self.matches(request.headers.get("if-none-match", "")):
+            return Response(status_code=304, headers=headers)
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type=media_type, headers=headers)
+
+
+def _smaller(compressed: bytes, identity: bytes):
+    # Tiny bodies can grow when compressed; keep only variants that actually help.
+    return compressed if len(compressed) < len(identity) else None
+
+
+def _parse_accept_encoding(header: str) -> set:
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding)
+    if "*" in accepted:
+        accepted.update(("br", "gzip"))
+    return accepted
@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+
+def make_key(algorithm: str, data, *options) -> str:
+    """Cache key for a simulation: the algorithm, its parsed input and output options.
+
+    Keyed on what parse_code_for_visualizer produced rather than the raw code,
+    so submissions differing only in whitespace or comments share an entry.
+    Dict order is kept as-is since simulators may iterate over it. The key
+    is a digest of that JSON, so large inputs don't sit in the cache (and
+    the single-flight table) uncounted by its byte bound.
+    """
+    canonical = json.dumps([algorithm, data, *options], ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class ResultCache:
+    """LRU cache of encoded visualization results, bounded by total bytes."""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, value, nbytes: int):
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= old[1]
+            while self._entries and self.nbytes + nbytes > self.max_bytes:
+                _, (_, size) = self._entries.popitem(last=False)
+                self.nbytes -= size
+                self.evictions += 1
+            self._entries[key] = (value, nbytes)
+            self.nbytes += nbytes
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key onto one execution.
+
+    The first caller for a key starts `fn()` as a task; callers arriving
+    while it runs await that same task and get its result (or its
+    exception). Everything happens on the event loop, so waiting callers
+    don't hold a thread, and a caller that goes away doesn't cancel the run
+    the others are waiting on.
+    """
+
+    def __init__(self):
+        self.leaders = 0
+        self.coalesced = 0
+        self._calls = {}  # key -> asyncio.Task
+
+    async def do(self, key: str, fn):
+        task = self._calls.get(key)
+        if task is None:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.leaders += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # retrieved, even if every caller went away
+
+    def stats(self) -> dict:
+        return {"running": len(self._calls), "leaders": self.leaders, "coalesced": self.coalesced}
+
+
+RESULTS = ResultCache()
+INFLIGHT = SingleFlight()
@@ -0,0 +1,180 @@
+import bisect
+import math
+import re
+from collections import defaultdict
+
+TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from if in into is it its of on or that the then this to was "
+    "we with".split()
+)
+
+# Per-field weight applied on top of BM25; the module title counts most.
+FIELD_BOOSTS = {
+    "module": 4.0,
+    "definition": 2.5,
+    "interview_notes": 1.8,
+    "working": 1.5,
+    "algorithm": 1.5,
+    "time_complexity": 1.2,
+    "space_complexity": 0.8,
+    "applications": 1.0,
+    "advantages": 0.8,
+    "disadvantages": 0.8,
+    "java": 0.6,
+}
+FIELDS = tuple(FIELD_BOOSTS)
+
+K1 = 1.2
+B = 0.75
+PREFIX_EXPANSIONS = 32
+SNIPPET_RADIUS = 60
+
+
+def field_text(entry: dict, field: str) -> str:
+    value = entry[field]
+    if isinstance(value, dict):
+        return "\n".join(f"{op}: {cost}" for op, cost in value.items())
+    return value
+
+
+def tokenize(text: str):
+    """Yield (term, start, end) for the searchable words in `text`."""
+    for m in TOKEN_RE.finditer(text):
+        term = m.group().lower()
+        if term not in STOPWORDS:
+            yield term, m.start(), m.end()
+
+
+def tokenize_java(code: str):
+    """Identifiers, plus their camelCase parts so `binarySearch` matches `search`."""
+    for m in IDENTIFIER_RE.finditer(code):
+        ident = m.group()
+        yield ident.lower(), m.start(), m.end()
+        parts = CAMEL_RE.findall(ident)
+        if len(parts) > 1:
+            for part in parts:
+                part = part.lower()
+                if part not in STOPWORDS:
+                    yield part, m.start(), m.end()
+
+
+class SearchIndex:
+    """Inverted index over every text field of every (module, level) entry.
+
+    Each posting stores its precomputed BM25 weight (field boost and length
+    normalisation included) and the offsets of the term's first occurrence,
+    so a query is only a few dict lookups and additions.
+    """
+
+    def __init__(self, content):
+        self.docs = []        # doc id -> (module, level)
+        self.texts = []       # doc id -> {field: text}
+        self.postings = {}    # term -> [(doc, field, weight, start, end)]
+        self.vocabulary = []  # sorted terms, for prefix expansion
+        self._build(content)
+
+    def _build(self, content):
+        counts = defaultdict(dict)  # term -> {(doc, field): [tf, start, end]}
+        lengths = defaultdict(dict)  # field -> {doc: length}
+        for module in content:
+            for level in content[module]:
+                entry = content[module][level]
+                doc = len(self.docs)
+                self.docs.append((module, level))
+                texts = {"module": module}
+                texts.update((field, field_text(entry, field)) for field in FIELDS if field != "module")
+                self.texts.append(texts)
+                for field, text in texts.items():
+                    tokens = tokenize_java(text) if field == "java" else tokenize(text)
+                    n = 0
+                    for term, start, end in tokens:
+                        n += 1
+                        slot = counts[term].get((doc, field))
+                        if slot is None:
+                            counts[term][(doc, field)] = [1, start, end]
+                        else:
+                            slot[0] += 1
+                    lengths[field][doc] = n
+
+        n_docs = len(self.docs)
+        avg = {field: (sum(docs.values()) / len(docs)) or 1.0 for field, docs in lengths.items()}
+        for term, hits in counts.items():
+            df = len({doc for doc, _ in hits})
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            plist = []
+            for (doc, field), (tf, start, end) in hits.items():
+                norm = K1 * (1 - B + B * lengths[field][doc] / avg[field])
+                weight = idf * FIELD_BOOSTS[field] * tf * (K1 + 1) / (tf + norm)
+                plist.append((doc, field, weight, start, end))
+            self.postings[term] = plist
+        self.vocabulary = sorted(self.postings)
+
+    def _expand(self, prefix: str):
+        i = bisect.bisect_left(self.vocabulary, prefix)
+        out = []
+        while i < len(self.vocabulary) and len(out) < PREFIX_EXPANSIONS:
+            term = self.vocabulary[i]
+            if not term.startswith(prefix):
+                break
+            out.append(term)
+            i += 1
+        return out
+
+    def search(self, query: str, limit: int = 10, prefix: bool = True):
+        terms = [term for term, _, _ in tokenize(query)]
+        if not terms:
+            return []
+        # The last word is usually still being typed, so it also matches as a prefix.
+        groups = [[t] for t in terms]
+        if prefix and query[-1:].isalnum():
+            groups[-1] = self._expand(terms[-1]) or groups[-1]
+
+        scores = defaultdict(float)
+        best = {}  # doc -> (weight, term, field, start, end) of its strongest hit
+        for group in groups:
+            # Prefix expansions are alternatives, not extra evidence, so a
+            # document scores by its best-matching expansion only.
+            group_scores = {}
+            for term in group:
+                term_scores = defaultdict(float)
+                for doc, field, weight, start, end in self.postings.get(term, ()):
+                    term_scores[doc] += weight
+                    if weight > best.get(doc, (0.0,))[0]:
+                        best[doc] = (weight, term, field, start, end)
+                for doc, score in term_scores.items():
+                    if score > group_scores.get(doc, 0.0):
+                        group_scores[doc] = score
+            for doc, score in group_scores.items():
+                scores[doc] += score
+
+        ranked = sorted(scores.items(), key=lambda item: -item[1])[:limit]
+        return [self._result(doc, score, best[doc]) for doc, score in ranked]
+
+    def _result(self, doc: int, score: float, hit):
+        _, term, field, start, end = hit
+        module, level = self.docs[doc]
+        text = self.texts[doc][field]
+        lo = max(0, start - SNIPPET_RADIUS)
+        hi = min(len(text), end + SNIPPET_RADIUS)
+        return {
+            "module": module,
+            "level": level,
+            "score": round(score, 4),
+            "match": {
+                "field": field,
+                "term": term,
+                "start": start,
+                "end": end,
+                "snippet": text[lo:hi],
+                "highlight": [start - lo, end - lo],
+            },
+        }
+
+
+def get_index(content) -> SearchIndex:
+    """The search index over `content`, built on first use (see ContentStore.derived)."""
+    return content.derived(SearchIndex)
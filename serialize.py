@@ -0,0 +1,18 @@
+"""JSON encoding shared by the API and the simulation pool.
+
+Kept free of web-framework imports so pool processes, which only run
+simulators, can encode their results without loading FastAPI.
+"""
+import json
+from typing import Any
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize exactly like FastAPI's JSONResponse so cached bodies are byte-identical."""
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
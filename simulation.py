@@ -0,0 +1,316 @@
+"""Running simulators under a budget, in a pool of worker processes.
+
+Simulators are pure-Python and CPU-bound, so a large trace run on the
+request threadpool holds the GIL and stalls every other request in the
+process. Whole traces are instead produced in a warm multiprocessing pool,
+and the request awaits the result on the event loop without holding a
+thread. At most MAX_WAITING requests wait on a process's pool at once;
+beyond that they're told the service is busy.
+
+Every run gets a step budget: the requested max_steps (default
+VISUALIZE_STEP_BUDGET, never above VISUALIZE_MAX_STEPS or a lower cap the
+algorithm registered). Generation stops as soon as the budget is used and
+the trace is marked truncated, alongside an estimate of how many steps the
+whole run would take. A whole trace also stops, truncated, at
+VISUALIZE_MAX_TRACE_BYTES of encoded steps. A run is also bounded by
+VISUALIZE_TIME_LIMIT seconds from when a worker starts it, which ends the
+request with a truncation error. A worker that stops answering altogether is killed and replaced on
+its own (see run).
+"""
+import asyncio
+import itertools
+import multiprocessing
+import multiprocessing.pool
+import os
+import signal
+import threading
+import time
+from typing import Any
+
+import trace_codec
+import visualizer_engine as ve
+from serialize import dumps
+
+DEFAULT_BUDGET = int(os.environ.get("VISUALIZE_STEP_BUDGET", 10_000))
+MAX_STEPS = int(os.environ.get("VISUALIZE_MAX_STEPS", 200_000))
+TIME_LIMIT = float(os.environ.get("VISUALIZE_TIME_LIMIT", 5.0))
+MAX_TRACE_BYTES = int(os.environ.get("VISUALIZE_MAX_TRACE_BYTES", 32 * 1024 * 1024))
+# Server processes on this host, each running its own pool; gunicorn.conf.py
+# sets it so the pools split the CPUs between them instead of each taking
+# a share of the whole machine.
+SERVER_WORKERS = max(1, int(os.environ.get("VISUALIZE_SERVER_WORKERS", 1)))
+# 0 runs simulations inline on the request thread (handy for debugging).
+WORKERS = int(os.environ.get("VISUALIZE_WORKERS", max(1, (os.cpu_count() or 1) // SERVER_WORKERS)))
+# How long past TIME_LIMIT to wait for a worker before giving up on it.
+GRACE = 2.0
+# How long a job may sit queued behind others before its request gives up,
+# and how often a waiting request checks on its job.
+QUEUE_LIMIT = float(os.environ.get("VISUALIZE_QUEUE_LIMIT", 60.0))
+POLL = 0.25
+# Requests that may wait on this process's pool at once.
+MAX_WAITING = int(os.environ.get("VISUALIZE_MAX_WAITING", 16 * max(WORKERS, 1)))
+BUSY = {"error": "The simulation service is busy; please retry shortly.", "retryable": True, "steps": []}
+
+
+class BudgetExceeded(Exception):
+    """A simulation ran past its time budget."""
+
+
+def start_simulation(alg: str, data: Any):
+    """Return the step generator for `alg`, or None if it isn't supported."""
+    entry = ve.get(alg)
+    return entry.start(data) if entry else None
+
+
+def start_frames(alg: str, data: Any):
+    """Like start_simulation, but yielding delta frames (see trace_codec)."""
+    entry = ve.get(alg)
+    return entry.start_frames(data) if entry else None
+
+
+def estimate_steps(alg: str, data: Any):
+    """Estimated total steps for a run, or None if it can't be told up front."""
+    entry = ve.get(alg)
+    return entry.estimate_steps(data) if entry else None
+
+
+def max_steps(alg: str = None) -> int:
+    """Largest step budget a run of `alg` may have: MAX_STEPS, or the
+    algorithm's own cap if it registered a lower one."""
+    entry = ve.get(alg) if alg else None
+    if entry is not None and entry.max_steps is not None:
+        return min(entry.max_steps, MAX_STEPS)
+    return MAX_STEPS
+
+
+def step_budget(requested: int = None, alg: str = None) -> int:
+    return min(requested or DEFAULT_BUDGET, max_steps(alg))
+
+
+def limits(alg: str) -> dict:
+    """The step budget limits that apply to `alg`."""
+    return {"default_max_steps": step_budget(alg=alg), "max_steps": max_steps(alg)}
+
+
+class Budgeted:
+    """Iterator over at most `budget` steps of a simulator.
+
+    Once the budget is used, one more step is pulled only to tell whether the
+    simulator had more (setting `truncated`), and the simulator is closed.
+    Raises BudgetExceeded when the simulator has spent more than `time_limit`
+    producing steps; only that time counts, so a paged trace that sits idle
+    between requests isn't charged for it.
+    """
+
+    __slots__ = ("steps", "budget", "time_limit", "count", "spent", "truncated")
+
+    def __init__(self, steps, budget: int = None, time_limit: float = None):
+        self.steps = iter(steps)
+        self.budget = step_budget() if budget is None else budget
+        self.time_limit = TIME_LIMIT if time_limit is None else time_limit
+        self.count = 0
+        self.spent = 0.0
+        self.truncated = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.steps is None:
+            raise StopIteration
+        start = time.monotonic()
+        try:
+            step = next(self.steps)
+        except StopIteration:
+            self.steps = None
+            raise
+        self.spent += time.monotonic() - start
+        if self.spent > self.time_limit:
+            self.close()
+            raise BudgetExceeded(f"Trace truncated: the simulation ran past the {self.time_limit:g}s time budget.")
+        if self.count == self.budget:
+            self.truncated = True
+            self.close()
+            raise StopIteration
+        self.count += 1
+        return step
+
+    def close(self):
+        if self.steps is not None and hasattr(self.steps, "close"):
+            self.steps.close()
+        self.steps = None
+
+
+def run_whole(alg: str, data: Any, format: str, keyframe_interval: int, budget: int = None):
+    """Produce a whole trace, encoded; runs in a pool process.
+
+    Returns (items, keyframes, meta) or an error dict. `items` holds each
+    encoded step (full format) or frame (delta format), `keyframes` the
+    indexes of full frames and `meta` truncated, total_steps_estimate and
+    budget. Once the items pass MAX_TRACE_BYTES the trace stops there,
+    truncated, so a simulator whose full steps grow with the trace can't
+    turn its step budget into a quadratic body.
+    """
+    steps = start_simulation(alg, data) if format == "full" else start_frames(alg, data)
+    if steps is None:
+        return {"error": f"Algorithm '{alg}' not supported yet.", "steps": []}
+    steps = Budgeted(steps, budget)
+    items = steps if format == "full" else trace_codec.with_keyframes(steps, keyframe_interval)
+    try:
+        encoded, keyframes = [], []
+        nbytes = 0
+        for i, item in enumerate(items):
+            body = dumps(item)
+            nbytes += len(body)
+            if nbytes > MAX_TRACE_BYTES:
+                steps.truncated = True
+                steps.close()
+                break
+            if "full" in item:
+                keyframes.append(i)
+            encoded.append(body)
+        if not encoded:
+            return {"error": "Simulator generated 0 steps for this code/input.", "steps": []}
+        meta = {"truncated": steps.truncated, "total_steps_estimate": estimate_steps(alg, data),
+                "budget": steps.budget}
+        return encoded, keyframes, meta
+    except BudgetExceeded as e:
+        return {"error": str(e), "truncated": True, "steps": []}
+
+
+_pool = None
+_lock = threading.Lock()
+_tokens = itertools.count()
+_started = {}     # job token -> (worker pid, when its start was reported)
+_reports = None   # in a pool process: queue to report job starts on
+
+
+def _init_worker(reports):
+    global _reports
+    _reports = reports
+
+
+def _deadline(signum, frame):
+    raise BudgetExceeded(f"Trace truncated: the simulation ran past the {TIME_LIMIT:g}s time budget.")
+
+
+def _run_job(token: int, alg: str, data: Any, format: str, keyframe_interval: int, budget: int):
+    """run_whole in a pool process, stopped TIME_LIMIT seconds after it starts.
+
+    Budgeted only checks the time between steps; the alarm also interrupts a
+    single step that runs on, so a job ends on time without anyone having to
+    kill its process.
+    """
+    _reports.put((token, os.getpid()))
+    if hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _deadline)
+        signal.setitimer(signal.ITIMER_REAL, TIME_LIMIT)
+    try:
+        return run_whole(alg, data, format, keyframe_interval, budget)
+    except BudgetExceeded as e:
+        return {"error": str(e), "truncated": True, "steps": []}
+    finally:
+        if hasattr(signal, "setitimer"):
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _collect_reports(reports):
+    while True:
+        token, pid = reports.get()
+        _started[token] = (pid, time.monotonic())
+
+
+def get_pool() -> multiprocessing.pool.Pool:
+    """Start the worker pool on first use; later calls return the same pool."""
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                # spawn, not fork: the server process has threads running.
+                ctx = multiprocessing.get_context("spawn")
+                reports = ctx.SimpleQueue()
+                threading.Thread(target=_collect_reports, args=(reports,), daemon=True).start()
+                _pool = ctx.Pool(WORKERS, initializer=_init_worker, initargs=(reports,))
+    return _pool
+
+
+def warm_pool():
+    """Start every worker process now so the first requests don't pay for it."""
+    if WORKERS:
+        pool = get_pool()
+        for result in [pool.apply_async(time.sleep, (0.05,)) for _ in range(WORKERS)]:
+            result.get()
+
+
+def _worker(pool: multiprocessing.pool.Pool, pid: int):
+    """The live pool process with `pid`, or None once it has exited."""
+    for process in list(pool._pool):
+        if process.pid == pid:
+            return process if process.exitcode is None else None
+    return None
+
+
+def _settle(future: asyncio.Future, value, failed: bool = False):
+    if not future.done():
+        if failed:
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+
+
+def _resolver(loop: asyncio.AbstractEventLoop, future: asyncio.Future, failed: bool = False):
+    """Pool callback (run on the pool's result thread) settling `future` on `loop`."""
+    def resolve(value):
+        try:
+            loop.call_soon_threadsafe(_settle, future, value, failed)
+        except RuntimeError:
+            pass  # the loop has closed; nobody is waiting any more
+    return resolve
+
+
+_waiting = asyncio.Semaphore(MAX_WAITING)
+
+
+async def run(alg: str, data: Any, format: str, keyframe_interval: int, budget: int):
+    """Whole encoded trace for a request, computed in the pool (see run_whole).
+
+    Awaited on the event loop, so waiting takes no thread. Time spent
+    queued behind other jobs isn't charged to this one: the deadline runs
+    from when a worker picks the job up. A worker that is still on it
+    GRACE seconds past the deadline is stuck (in code the alarm can't
+    interrupt), so that one process is killed and the pool starts a fresh
+    one; other jobs carry on.
+    """
+    if not WORKERS:
+        return await asyncio.to_thread(run_whole, alg, data, format, keyframe_interval, budget)
+    if _waiting.locked():
+        return dict(BUSY)
+    async with _waiting:
+        pool = get_pool()
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        token = next(_tokens)
+        pool.apply_async(_run_job, (token, alg, data, format, keyframe_interval, budget),
+                         callback=_resolver(loop, done), error_callback=_resolver(loop, done, failed=True))
+        queued = time.monotonic()
+        try:
+            while True:
+                await asyncio.wait((done,), timeout=POLL)
+                if done.done():
+                    return done.result()
+                started = _started.get(token)
+                if started is None:
+                    if time.monotonic() - queued > QUEUE_LIMIT:
+                        return dict(BUSY)
+                    continue
+                pid, at = started
+                process = _worker(pool, pid)
+                if process is None:
+                    return {"error": "The simulation worker stopped unexpectedly; please retry.",
+                            "retryable": True, "steps": []}
+                if time.monotonic() - at > TIME_LIMIT + GRACE:
+                    process.kill()
+                    return {"error": f"Trace truncated: the simulation ran past the {TIME_LIMIT:g}s time budget.",
+                            "truncated": True, "steps": []}
+        finally:
+            _started.pop(token, None)
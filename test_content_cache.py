@@ -0,0 +1,48 @@
+from fastapi.testclient import TestClient
+
+import content_store
+import main
+
+client = TestClient(main.app)
+MODULE = "/module/Arrays/Beginner"
+
+
+def test_repeat_with_etag_gets_304():
+    first = client.get(MODULE, headers={"accept-encoding": "identity"})
+    etag = first.headers["etag"]
+    assert first.status_code == 200 and first.json()["definition"]
+    again = client.get(MODULE, headers={"accept-encoding": "identity", "if-none-match": etag})
+    assert again.status_code == 304 and again.headers["etag"] == etag and again.content == b""
+
+
+def test_etag_differs_per_encoding_but_validates_any():
+    plain = client.get(MODULE, headers={"accept-encoding": "identity"})
+    gzipped = client.get(MODULE, headers={"accept-encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.headers["etag"] == plain.headers["etag"][:-1] + '-gzip"'
+    again = client.get(MODULE, headers={"accept-encoding": "identity", "if-none-match": gzipped.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_projection_returns_the_selected_fields():
+    full = client.get(MODULE)
+    projected = client.get(MODULE, params={"fields": "java, definition"})
+    assert list(projected.json()) == ["definition", "java"]
+    assert projected.json() == {"definition": full.json()["definition"], "java": full.json()["java"]}
+    assert projected.headers["etag"] != full.headers["etag"]
+
+
+def test_projection_of_unknown_fields_is_an_error():
+    body = client.get(MODULE, params={"fields": "definition,nope"}).json()
+    assert body["error"] == "Unknown field(s): nope"
+    assert body["fields"] == list(content_store.CONTENT_FIELDS)
+
+
+def test_projection_cache_is_bounded():
+    entry = content_store.DSA_CONTENT.entry("Arrays", "Beginner")
+    fields = content_store.CONTENT_FIELDS
+    sets = [fields[:i] for i in range(1, len(fields) + 1)]
+    for selected in sets:
+        entry.projection(selected)
+    assert len(entry._projections) == content_store.PROJECTION_CACHE_SIZE
+    assert list(entry._projections) == sets[-content_store.PROJECTION_CACHE_SIZE:]
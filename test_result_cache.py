@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import result_cache
+import simulation
+from result_cache import ResultCache, SingleFlight, make_key
+
+client = TestClient(main.app)
+
+
+def test_make_key_covers_input_and_options():
+    key = make_key("bfs", {"start": 0}, 100, "full")
+    assert key == make_key("bfs", {"start": 0}, 100, "full")
+    assert key != make_key("bfs", {"start": 1}, 100, "full")
+    assert key != make_key("bfs", {"start": 0}, 200, "full")
+    assert key != make_key("bfs", {"start": 0}, 100, "delta", 500)
+    assert len(make_key("strings", {"s": "\ud800"}, 100, "full")) == 64  # lone surrogates still hash
+
+
+def test_result_cache_evicts_least_recently_used_by_bytes():
+    cache = ResultCache(max_bytes=100)
+    cache.put("a", "A", 40)
+    cache.put("b", "B", 40)
+    assert cache.get("a") == "A"  # now the most recently used
+    cache.put("c", "C", 40)
+    assert cache.get("b") is None
+    assert cache.get("a") == "A" and cache.get("c") == "C"
+    stats = cache.stats()
+    assert stats["bytes"] == 80 and stats["evictions"] == 1
+
+
+def test_result_cache_skips_values_over_its_bound():
+    cache = ResultCache(max_bytes=10)
+    cache.put("big", "x" * 11, 11)
+    assert cache.get("big") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_single_flight_runs_concurrent_calls_once():
+    flight = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def burst():
+        return await asyncio.gather(*(flight.do("key", work) for _ in range(10)))
+
+    assert asyncio.run(burst()) == ["result"] * 10
+    assert len(runs) == 1
+    assert flight.stats() == {"running": 0, "leaders": 1, "coalesced": 9}
+
+
+def test_single_flight_shares_exceptions_then_runs_again():
+    flight = SingleFlight()
+    runs = []
+
+    async def work():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def burst():
+        return await asyncio.gather(*(flight.do("key", work) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(e, ValueError) for e in asyncio.run(burst()))
+    assert len(runs) == 1
+    with pytest.raises(ValueError):
+        asyncio.run(flight.do("key", work))
+    assert len(runs) == 2
+
+
+def test_single_flight_survives_a_caller_going_away():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def leader_leaves():
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(leader_leaves()) == "result"
+
+
+@pytest.mark.parametrize("format", ["full", "delta"])
+def test_visualize_serves_repeats_from_the_cache(monkeypatch, format):
+    monkeypatch.setattr(simulation, "WORKERS", 0)
+    monkeypatch.setattr(result_cache, "RESULTS", ResultCache())
+    request = {"algorithm": "bubble_sort", "input": [3, 1, 2], "format": format}
+    first = client.post("/visualize", json=request)
+    second = client.post("/visualize", json=request)
+    assert first.status_code == 200 and "error" not in first.json()
+    assert first.content == second.content
+    stats = result_cache.RESULTS.stats()
+    assert stats["entries"] == 1 and stats["hits"] == 1 and stats["misses"] == 1
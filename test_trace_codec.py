@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+import trace_codec
+import visualizer_engine as ve
+
+# A few inputs per simulator, including every mode that changes the frames.
+SAMPLES = [
+    ("bubble_sort", [5, 1, 4, 2, 8, 0]),
+    ("insertion_sort", [9, 7, 5, 3, 1, 2]),
+    ("binary_search", {"arr": [1, 3, 5, 7, 9, 11, 13], "target": 11}),
+    ("factorial", 5),
+    ("stack", [{"action": "push", "value": 1}, {"action": "push", "value": 2},
+               {"action": "pop", "value": None}, {"action": "pop", "value": None},
+               {"action": "pop", "value": None}]),
+    ("queue", [{"action": "enqueue", "value": i} if i % 3 else {"action": "dequeue", "value": None}
+               for i in range(12)]),
+    ("queue", {"ops": [{"action": "enqueue", "value": i} if i % 3 else {"action": "dequeue", "value": None}
+                       for i in range(12)], "capacity": 3}),
+    ("arrays", {"arr": [4, 8, 15, 16, 23, 42], "ops": [{"action": "access", "index": 2},
+                                                     {"action": "update", "index": 0, "value": 7},
+                                                     {"action": "search", "value": 23}]}),
+    ("strings", {"s": "racecar", "action": "palindrome"}),
+    ("strings", {"s": "hello", "action": "reverse"}),
+    ("backtracking", 5),
+    ("heap", {"arr": [10, 20, 30, 40], "action": "insert", "val": 5}),
+    ("heap", {"arr": [10, 20, 30, 40], "action": "extract", "val": None}),
+    ("hashing", {"keys": [10, 17, 24, 3, 31], "size": 7}),
+    ("linked_lists", {"arr": [1, 2, 3], "action": "insert", "val": 9, "pos": 1}),
+    ("linked_lists", {"arr": [1, 2, 3], "action": "delete", "val": 0, "pos": 2}),
+    ("greedy_algorithms", {"amount": 63, "coins": [25, 10, 5, 1]}),
+    ("dynamic_programming", {"n": 12, "mode": "memo"}),
+    ("dynamic_programming", {"n": 12, "mode": "tabulation"}),
+    ("dynamic_programming", {"n": 90, "mode": "rolling"}),
+    ("bit_manipulation", {"val": 12, "op": "XOR", "mask": 10}),
+    ("tries", ["code", "cool", "coder"]),
+    ("segment_trees", [1, 3, 5, 7, 9, 11]),
+    ("disjoint_set_union", {"n": 6, "ops": [["union", 0, 1], ["union", 2, 3], ["union", 1, 3],
+                                            ["find", 3, None], ["union", 4, 5], ["find", 5, None]],
+                            "find": "halving", "union": "size"}),
+    ("disjoint_set_union", {"n": 5, "ops": [["union", 0, 1], ["union", 1, 2], ["find", 2, None]],
+                            "find": "naive", "union": "naive"}),
+    ("bfs", {"adj": {"A": ["B", "C"], "B": ["D"], "C": ["D", "E"], "E": ["A"]}, "start": "A"}),
+    ("bfs", {"edges": [[0, 1], [1, 2], [0, 3], [3, 4]], "start": 0, "directed": False,
+             "granularity": "level"}),
+    ("dfs", {"adj": {"A": ["B", "C"], "B": ["D"], "C": ["D", "E"], "E": ["A"]}, "start": "A"}),
+    ("dfs", {"edges": [[0, 1], [1, 2], [0, 3], [3, 4]], "start": 0, "directed": False, "events": "pre"}),
+    ("dfs", {"edges": [[0, 1], [1, 2], [0, 3], [3, 4]], "start": 0, "events": "post"}),
+]
+SAMPLE_IDS = [f"{alg}-{i}" for i, (alg, _) in enumerate(SAMPLES)]
+KEYFRAME_INTERVALS = (1, 3, 500)
+
+
+def wire(value):
+    """`value` as a client would read it back from the JSON response."""
+    return json.loads(json.dumps(value))
+
+
+def full_steps(alg, data):
+    return wire([trace_codec.normalize(step) for step in ve.get(alg).start(data)])
+
+
+@pytest.mark.parametrize("alg,data", SAMPLES, ids=SAMPLE_IDS)
+def test_encode_decode_round_trip(alg, data):
+    full = full_steps(alg, data)
+    assert full, "no steps"
+    assert wire(list(trace_codec.decode(wire(list(trace_codec.encode(full)))))) == full
+
+
+@pytest.mark.parametrize("interval", KEYFRAME_INTERVALS)
+@pytest.mark.parametrize("alg,data", SAMPLES, ids=SAMPLE_IDS)
+def test_delta_frames_decode_to_full_steps(alg, data, interval):
+    full = full_steps(alg, data)
+    frames = wire(list(trace_codec.with_keyframes(ve.get(alg).start_frames(data), interval)))
+    assert wire(list(trace_codec.decode(frames))) == full
+    # Seeking: replaying from each keyframe must rebuild the later steps too.
+    for start in (i for i, frame in enumerate(frames) if "full" in frame):
+        assert wire(list(trace_codec.decode(frames[start:]))) == full[start:], f"replay from keyframe {start}"
+
+
+def test_every_algorithm_has_a_sample():
+    covered = {alg for alg, _ in SAMPLES}
+    assert sorted(entry.id for entry in ve.algorithms() if entry.id not in covered) == []
+
+
+def test_keyframes_are_spaced_by_state_size():
+    data = {"n": 1000, "ops": [["find", 0, None]] * 3000}
+    frames = trace_codec.with_keyframes(ve.get("disjoint_set_union").start_frames(data), 10)
+    keyframes = [i for i, frame in enumerate(frames) if "full" in frame]
+    assert keyframes[0] == 0 and len(keyframes) > 1
+    assert all(b - a >= 1000 for a, b in zip(keyframes, keyframes[1:]))
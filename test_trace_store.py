@@ -0,0 +1,103 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import result_cache
+import simulation
+import trace_store
+from trace_store import Trace, TraceStore
+
+client = TestClient(main.app)
+META = {"budget": 10, "truncated": False, "total_steps_estimate": 3}
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = TraceStore()
+    monkeypatch.setattr(trace_store, "TRACES", store)
+    return store
+
+
+def sorting_trace(n: int = 40) -> Trace:
+    steps = simulation.Budgeted(simulation.start_simulation("bubble_sort", list(range(n, 0, -1))), 10_000)
+    return Trace(steps, "full", None, steps, None)
+
+
+def page(trace: Trace, cursor: int, limit: int) -> dict:
+    return json.loads(main.trace_page(trace, cursor, limit).body)
+
+
+def test_pages_report_total_once_done(store):
+    trace = sorting_trace()
+    store.put(store.new_id(), trace)
+    first = page(trace, 0, 10)
+    assert first["next_cursor"] == 10 and first["total"] is None
+    trace.fill(10 ** 6, store)
+    middle = page(trace, 10, 10)
+    assert middle["next_cursor"] == 20 and middle["total"] == len(trace.items)
+    last = page(trace, len(trace.items) - 5, 10)
+    assert last["next_cursor"] is None and len(last["steps"]) == 5
+
+
+def test_evicting_a_generating_trace_reports_it(monkeypatch):
+    store = TraceStore(max_bytes=200_000)
+    monkeypatch.setattr(trace_store, "TRACES", store)
+    streamed = sorting_trace(60)
+    store.put(store.new_id(), streamed)
+    lines = main.stream_steps(streamed.drain(store), "application/x-ndjson", {}, streamed)
+    for _ in range(50):
+        next(lines)
+    other = sorting_trace(60)
+    store.put(store.new_id(), other)
+    other.fill(10 ** 6, store)  # needs the room, so the streamed trace is evicted
+    last = json.loads(list(lines)[-1])
+    assert "evicted" in last["error"] and last["steps_sent"] == 50
+    assert streamed.truncated
+
+
+def test_byte_bound_evicts_least_recently_used():
+    store = TraceStore(max_bytes=10)
+    old = Trace.completed([b"12345"], [], meta=META)
+    new = Trace.completed([b"123456"], [], meta=META)
+    store.put("old", old)
+    store.put("new", new)
+    assert store.get("old") is None and store.get("new") is new
+    assert store.stats()["bytes"] == 6
+
+
+def test_get_or_put_keeps_one_copy(tmp_path):
+    store = TraceStore(shared_dir=str(tmp_path))
+    made = []
+
+    def make():
+        made.append(1)
+        return Trace.completed([b"{}"] * 3, [0], "delta", 500, META)
+
+    first = store.get_or_put("0" * 32, make)
+    assert store.get_or_put("0" * 32, make) is first
+    assert len(made) == 1
+    assert store.stats()["bytes"] == 6
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_shared_dir_serves_finished_traces_to_other_stores(tmp_path):
+    one, two = TraceStore(shared_dir=str(tmp_path)), TraceStore(shared_dir=str(tmp_path))
+    trace = sorting_trace()
+    one.put(one.new_id(), trace)
+    trace.fill(10 ** 6, one)  # finishing publishes it
+    loaded = two.get(trace.trace_id)
+    assert loaded.done and loaded.items == trace.items and loaded.meta() == trace.meta()
+    assert two.get("not-a-trace-id") is None
+
+
+def test_cached_delta_hits_share_one_trace(monkeypatch, store):
+    monkeypatch.setattr(simulation, "WORKERS", 0)
+    monkeypatch.setattr(result_cache, "RESULTS", result_cache.ResultCache())
+    request = {"algorithm": "bubble_sort", "input": [5, 4, 3, 2, 1], "format": "delta"}
+    ids = {client.post("/visualize", json=request).json()["trace_id"] for _ in range(3)}
+    assert len(ids) == 1
+    assert store.stats()["traces"] == 1
+    frame = client.get(f"/visualize/{ids.pop()}/frame/3").json()
+    assert frame["frame"] == 3 and "step" in frame
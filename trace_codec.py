@@ -0,0 +1,242 @@
+"""Delta encoding for visualizer traces.
+
+A trace is a list of frames. The first frame is ``{"full": step}``, a
+complete step in the usual shape (line, variables, array, pointers, stack,
+explanation). Every later frame is ``{"delta": change}``, holding only what
+differs from the previous step:
+
+* ``line`` / ``explanation``: the new value, present only if it changed.
+* ``variables`` / ``pointers``: ``{"set": {key: value}, "del": [key]}``.
+* ``array`` / ``stack``: ``{"shift": k, "len": n, "set": [[i, v], ...]}``,
+  applied in that order: drop k items from the front, truncate to n, then
+  assign each index (an index equal to the current length appends). A
+  ``{"replace": [...]}`` is sent instead when most of the list changed.
+
+A step that omits a key is treated as having it empty, so decoded steps
+always carry all six keys.
+
+Most simulators yield full steps and are encoded here. Simulators
+registered with ``frames=True`` (see visualizer_engine.register) yield
+frames themselves, so a step costs only what changed; their full steps
+come from ``decode``.
+
+Long traces repeat a ``full`` frame (a keyframe) every K steps, or every
+S steps when the step holds S > K list items and keys, so any step can be
+rebuilt by replaying at most max(K, S) - 1 deltas from the nearest
+keyframe without keyframes outweighing the deltas (see with_keyframes).
+"""
+from typing import Any, Dict, Iterable, Iterator, List
+
+LIST_FIELDS = ("array", "stack")
+DICT_FIELDS = ("variables", "pointers")
+SCALAR_FIELDS = ("line", "explanation")
+STEP_FIELDS = ("line", "variables", "array", "pointers", "stack", "explanation")
+
+
+def normalize(step: Dict[str, Any]) -> Dict[str, Any]:
+    """Fill in any of the six step keys a simulator left out."""
+    return {
+        "line": step.get("line"),
+        "variables": step.get("variables") or {},
+        "array": step.get("array") or [],
+        "pointers": step.get("pointers") or {},
+        "stack": step.get("stack") or [],
+        "explanation": step.get("explanation", ""),
+    }
+
+
+def diff_list(prev: List[Any], cur: List[Any]):
+    if prev is cur or prev == cur:
+        return None
+    n_prev, n_cur = len(prev), len(cur)
+    if n_cur < n_prev and cur == prev[n_prev - n_cur:]:
+        return {"shift": n_prev - n_cur}
+    changes = [[i, cur[i]] for i in range(min(n_prev, n_cur)) if prev[i] != cur[i]]
+    changes.extend([i, cur[i]] for i in range(n_prev, n_cur))
+    if 2 * len(changes) > n_cur + 1:
+        return {"replace": cur}
+    out = {}
+    if n_cur < n_prev:
+        out["len"] = n_cur
+    if changes:
+        out["set"] = changes
+    return out
+
+
+def diff_dict(prev: Dict[str, Any], cur: Dict[str, Any]):
+    if prev is cur or prev == cur:
+        return None
+    out = {}
+    changed = {k: v for k, v in cur.items() if k not in prev or prev[k] != v}
+    if changed:
+        out["set"] = changed
+    removed = [k for k in prev if k not in cur]
+    if removed:
+        out["del"] = removed
+    return out
+
+
+def diff_fields(prev: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+    """Delta for the scalar and dict fields only.
+
+    Simulators that emit frames themselves use this for the small fields and
+    add the list changes they already know, without comparing whole lists.
+    """
+    delta = {}
+    for field in SCALAR_FIELDS:
+        if cur[field] != prev[field]:
+            delta[field] = cur[field]
+    for field in DICT_FIELDS:
+        change = diff_dict(prev[field], cur[field])
+        if change is not None:
+            delta[field] = change
+    return delta
+
+
+def diff(prev: Dict[str, Any], cur: Dict[str, Any]) -> Dict[str, Any]:
+    """Delta taking normalized step `prev` to normalized step `cur`."""
+    delta = diff_fields(prev, cur)
+    for field in LIST_FIELDS:
+        change = diff_list(prev[field], cur[field])
+        if change is not None:
+            delta[field] = change
+    return delta
+
+
+class Framer:
+    """Builds the frames of a simulator registered with ``frames=True``.
+
+    Each call gets the current step, with the simulator's live ``array`` and
+    ``stack`` lists, plus the list changes it made since the previous call.
+    Lists are copied for the first (full) frame only; after that, scalar
+    and dict fields are diffed and the given list changes attached as-is.
+    """
+
+    def __init__(self):
+        self.prev = None
+
+    def frame(self, step: Dict[str, Any], **changes) -> Dict[str, Any]:
+        small = {field: step.get(field) for field in SCALAR_FIELDS}
+        small.update((field, step.get(field) or {}) for field in DICT_FIELDS)
+        if self.prev is None:
+            frame = {"full": normalize({
+                **small, "array": list(step.get("array") or ()), "stack": list(step.get("stack") or ())})}
+        else:
+            delta = diff_fields(self.prev, small)
+            delta.update((field, change) for field, change in changes.items() if change)
+            frame = {"delta": delta}
+        self.prev = small
+        return frame
+
+
+def appended(start: int, items: Iterable[Any]):
+    """List change appending `items` to a list that had `start` items (None if there are none)."""
+    changes = [[i, item] for i, item in enumerate(items, start)]
+    return {"set": changes} if changes else None
+
+
+def encode(steps: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Turn a stream of full steps into delta frames, lazily."""
+    prev = None
+    for step in steps:
+        step = normalize(step)
+        yield {"full": step} if prev is None else {"delta": diff(prev, step)}
+        prev = step
+
+
+def with_keyframes(frames: Iterable[Dict[str, Any]], interval: int) -> Iterator[Dict[str, Any]]:
+    """Re-emit delta frames with full keyframes at least `interval` steps apart.
+
+    A keyframe costs as much as the whole step, so keyframes are also kept
+    at least as many steps apart as the step has list items and keys. A
+    large state (a 10^5-node parent array, say) is then not copied every
+    `interval` steps, and keyframes add about one item per step at most.
+    """
+    state = TraceState()
+    last = 0
+    for i, frame in enumerate(frames):
+        state.apply(frame)
+        if "full" in frame:
+            last = i
+        elif i - last >= interval and i - last >= state.size():
+            frame = {"full": state.snapshot()}
+            last = i
+        yield frame
+
+
+class TraceState:
+    """Current step rebuilt by applying frames one after another."""
+
+    def __init__(self):
+        self.step = None
+
+    def apply(self, frame: Dict[str, Any]):
+        if "full" in frame:
+            full = frame["full"]
+            self.step = {
+                "line": full["line"],
+                "variables": dict(full["variables"]),
+                "array": list(full["array"]),
+                "pointers": dict(full["pointers"]),
+                "stack": list(full["stack"]),
+                "explanation": full["explanation"],
+            }
+            return
+        step = self.step
+        delta = frame["delta"]
+        for field in SCALAR_FIELDS:
+            if field in delta:
+                step[field] = delta[field]
+        for field in DICT_FIELDS:
+            change = delta.get(field)
+            if change:
+                target = step[field]
+                for key in change.get("del", ()):
+                    target.pop(key, None)
+                target.update(change.get("set", {}))
+        for field in LIST_FIELDS:
+            change = delta.get(field)
+            if change:
+                _apply_list(step, field, change)
+
+    def size(self) -> int:
+        """List items and keys in the current step, a rough measure of its encoded size."""
+        step = self.step
+        return len(step["array"]) + len(step["stack"]) + len(step["variables"]) + len(step["pointers"])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """An independent copy of the current step."""
+        step = self.step
+        return {
+            "line": step["line"],
+            "variables": dict(step["variables"]),
+            "array": list(step["array"]),
+            "pointers": dict(step["pointers"]),
+            "stack": list(step["stack"]),
+            "explanation": step["explanation"],
+        }
+
+
+def _apply_list(step, field, change):
+    if "replace" in change:
+        step[field] = list(change["replace"])
+        return
+    target = step[field]
+    if change.get("shift"):
+        del target[:change["shift"]]
+    if "len" in change:
+        del target[change["len"]:]
+    for i, value in change.get("set", ()):
+        if i < len(target):
+            target[i] = value
+        else:
+            target.extend([None] * (i - len(target)))
+            target.append(value)
+
+
+def decode(frames: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Rebuild full steps from frames (the client-side algorithm, in Python)."""
+    state = TraceState()
+    for frame in frames:
+        state.apply(frame)
+        yield state.snapshot()
@@ -0,0 +1,354 @@
+"""Server-side traces for paging, seeking and streaming.
+
+A trace lives in the memory of the server process that created it and is
+generated lazily as readers ask for more. When several server processes
+share a host (gunicorn workers, see gunicorn.conf.py), the next request for
+a trace may land on a different process, so finished traces are also
+written to a directory every process reads (VISUALIZE_TRACE_DIR, by default
+a directory under the system temp dir). A process that doesn't hold a trace
+loads it from there. A trace that is still being generated, such as one
+whose stream is in progress, can only be read by its own process until it
+finishes. Across hosts, point VISUALIZE_TRACE_DIR at shared storage or
+route requests for a trace id to one host.
+"""
+import bisect
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import trace_codec
+from serialize import dumps
+from simulation import SERVER_WORKERS, BudgetExceeded, Budgeted
+
+SHARED_DIR = os.environ.get("VISUALIZE_TRACE_DIR") or (
+    os.path.join(tempfile.gettempdir(), "visualize-traces") if SERVER_WORKERS > 1 else None)
+TRACE_ID_RE = re.compile(r"[0-9a-f]{32}")
+
+
+class Trace:
+    """One visualization trace, possibly still being generated.
+
+    Steps (or delta frames) are pulled from the suspended simulator only as
+    far as a reader asks, and each one is kept as its encoded JSON bytes so
+    pages are served by joining bytes and the store can account memory
+    exactly.
+    """
+
+    __slots__ = ("trace_id", "format", "keyframe_interval", "items", "keyframes", "nbytes",
+                 "source", "limit", "estimate", "error", "_truncated", "last_access", "lock")
+
+    def __init__(self, steps, format: str = "full", keyframe_interval: int = None,
+                 limit: Budgeted = None, estimate: int = None):
+        self.trace_id = None  # set when the trace is put in a store
+        self.format = format
+        self.keyframe_interval = keyframe_interval
+        self.items = []      # encoded step/frame bytes, in order
+        self.keyframes = []  # indexes of full frames (delta format)
+        self.nbytes = 0
+        self.source = iter(steps)
+        self.limit = limit   # the step budget `steps` is drawn through, if any
+        self.estimate = estimate
+        self.error = None
+        self._truncated = False
+        self.last_access = time.monotonic()
+        self.lock = threading.Lock()
+
+    @classmethod
+    def completed(cls, items, keyframes, format: str = "full", keyframe_interval: int = None,
+                  meta: dict = None) -> "Trace":
+        """A finished trace over already-encoded items (e.g. from the result cache)."""
+        trace = cls((), format, keyframe_interval)
+        trace.items = list(items)
+        trace.keyframes = list(keyframes)
+        trace.nbytes = sum(map(len, trace.items))
+        trace.source = None
+        if meta:
+            trace.limit = _SpentBudget(meta["budget"], meta["truncated"])
+            trace.estimate = meta["total_steps_estimate"]
+        return trace
+
+    @property
+    def truncated(self) -> bool:
+        return self._truncated or (self.limit is not None and self.limit.truncated)
+
+    @truncated.setter
+    def truncated(self, value: bool):
+        self._truncated = value
+
+    def meta(self) -> dict:
+        return {
+            "truncated": self.truncated,
+            "total_steps_estimate": self.estimate,
+            "budget": self.limit.budget if self.limit is not None else None,
+        }
+
+    @property
+    def done(self) -> bool:
+        return self.source is None
+
+    def _pull(self, store: "TraceStore"):
+        """Generate and keep one more item; returns its bytes or None at the end."""
+        try:
+            item = next(self.source)
+        except StopIteration:
+            return self._finish(store)
+        except BudgetExceeded as e:
+            self.error = str(e)
+            self.truncated = True
+            return self._finish(store)
+        except Exception as e:
+            self.error = f"Execution Error: {str(e)}"
+            return self._finish(store)
+        body = dumps(item)
+        if not store.charge(self, len(body)):
+            # Keeping this step would push the store past its memory cap even
+            # after evicting every other trace; stop the trace here instead.
+            self.truncated = True
+            return self._finish(store)
+        if "full" in item:
+            self.keyframes.append(len(self.items))
+        self.items.append(body)
+        self.nbytes += len(body)
+        return body
+
+    def _finish(self, store: "TraceStore"):
+        self.source = None
+        store.publish(self)
+        return None
+
+    def fill(self, upto: int, store: "TraceStore"):
+        with self.lock:
+            while self.source is not None and len(self.items) < upto:
+                self._pull(store)
+
+    def drain(self, store: "TraceStore"):
+        """Yield every item's bytes from the start, generating the rest as needed."""
+        i = 0
+        while True:
+            # Only hold the lock while generating, not while the caller
+            # writes the item out, so page readers aren't blocked by a slow
+            # streaming client.
+            with self.lock:
+                if i >= len(self.items) and (self.source is None or self._pull(store) is None):
+                    return
+                body = self.items[i]
+            yield body
+            i += 1
+
+    def page(self, cursor: int, limit: int, store: "TraceStore"):
+        self.fill(cursor + limit, store)
+        return self.items[cursor:cursor + limit]
+
+    def frame(self, n: int):
+        """Full step `n`; delta traces replay from the nearest keyframe."""
+        if self.format != "delta":
+            return json.loads(self.items[n])
+        start = self.keyframes[bisect.bisect_right(self.keyframes, n) - 1]
+        state = trace_codec.TraceState()
+        for body in self.items[start:n + 1]:
+            state.apply(json.loads(body))
+        return state.snapshot()
+
+
+class _SpentBudget:
+    """Budget outcome of a trace generated elsewhere (see Trace.completed)."""
+
+    __slots__ = ("budget", "truncated")
+
+    def __init__(self, budget: int, truncated: bool):
+        self.budget = budget
+        self.truncated = truncated
+
+
+class TraceStore:
+    """Traces kept for paging and seeking, bounded by idle TTL and total bytes.
+
+    With `shared_dir`, finished traces are also written there (one file
+    each, under the same TTL and byte bound) and traces this store doesn't
+    hold are looked up there, so every process on the host can serve them.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, ttl: float = 600.0, shared_dir: str = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.shared_dir = shared_dir
+        self.nbytes = 0
+        self._traces = OrderedDict()
+        self._lock = threading.Lock()
+        if shared_dir:
+            os.makedirs(shared_dir, exist_ok=True)
+
+    @property
+    def shared(self) -> bool:
+        return self.shared_dir is not None
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex
+
+    def put(self, trace_id: str, trace: Trace):
+        with self._lock:
+            self._expire()
+            self._keep(trace_id, trace)
+        if trace.done:
+            self.publish(trace)
+
+    def get(self, trace_id: str):
+        with self._lock:
+            self._expire()
+            trace = self._traces.get(trace_id)
+            if trace is not None:
+                trace.last_access = time.monotonic()
+                self._traces.move_to_end(trace_id)
+                return trace
+        trace = self._load(trace_id)
+        if trace is not None:
+            with self._lock:
+                # Another request may have loaded it meanwhile; keep that one.
+                if trace_id in self._traces:
+                    return self._traces[trace_id]
+                self._keep(trace_id, trace)
+        return trace
+
+    def get_or_put(self, trace_id: str, make) -> Trace:
+        """The trace stored as `trace_id`, here or in the shared directory;
+        failing that, `make()` is stored (and published) under it.
+
+        For traces whose id is derived from their content, so repeated
+        requests for the same result share one stored copy.
+        """
+        trace = self.get(trace_id)
+        if trace is not None:
+            return trace
+        trace = make()
+        with self._lock:
+            if trace_id in self._traces:
+                return self._traces[trace_id]
+            self._keep(trace_id, trace)
+        if trace.done:
+            self.publish(trace)
+        return trace
+
+    def _keep(self, trace_id: str, trace: Trace):
+        self._make_room(trace.nbytes, trace)
+        trace.trace_id = trace_id
+        self._traces[trace_id] = trace
+        self.nbytes += trace.nbytes
+
+    def publish(self, trace: Trace):
+        """Write a finished trace to the shared directory, if there is one.
+
+        The file is a JSON header line followed by one encoded item per
+        line (encoded JSON never holds a raw newline).
+        """
+        if not self.shared or trace.trace_id is None:
+            return
+        head = dict(trace.meta(), format=trace.format, keyframe_interval=trace.keyframe_interval,
+                    keyframes=trace.keyframes, error=trace.error)
+        path = self._path(trace.trace_id)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(dumps(head))
+                for item in trace.items:
+                    f.write(b"\n")
+                    f.write(item)
+            os.replace(tmp, path)
+            self._sweep()
+        except OSError:
+            # Out of space or similar: the trace is still served from here.
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def _load(self, trace_id: str):
+        if not self.shared or not TRACE_ID_RE.fullmatch(trace_id):
+            return None
+        path = self._path(trace_id)
+        try:
+            with open(path, "rb") as f:
+                lines = f.read().split(b"\n")
+            os.utime(path)  # reading counts as use for the TTL
+        except FileNotFoundError:
+            return None
+        head = json.loads(lines[0])
+        trace = Trace.completed(lines[1:], head["keyframes"], head["format"], head["keyframe_interval"], head)
+        trace.error = head["error"]
+        return trace
+
+    def _path(self, trace_id: str) -> str:
+        return os.path.join(self.shared_dir, f"{trace_id}.trace")
+
+    def _sweep(self):
+        """Drop shared files idle past the TTL, then the oldest while over max_bytes."""
+        files = []
+        cutoff = time.time() - self.ttl
+        for entry in os.scandir(self.shared_dir):
+            if not entry.name.endswith(".trace"):
+                continue
+            try:
+                stat = entry.stat()
+                if stat.st_mtime < cutoff:
+                    os.remove(entry.path)
+                else:
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+            except FileNotFoundError:
+                pass  # another process swept it first
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def charge(self, trace: Trace, nbytes: int) -> bool:
+        """Reserve room for `nbytes` more of `trace`, evicting idle traces LRU-first."""
+        with self._lock:
+            trace.last_access = time.monotonic()
+            tracked = self._traces.get(trace.trace_id) is trace
+            self._make_room(nbytes, trace)
+            if self.nbytes + nbytes > self.max_bytes:
+                return False
+            if tracked:
+                self.nbytes += nbytes
+                self._traces.move_to_end(trace.trace_id)
+            return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"traces": len(self._traces), "bytes": self.nbytes, "max_bytes": self.max_bytes,
+                    "shared_dir": self.shared_dir}
+
+    def _make_room(self, nbytes: int, keep: Trace):
+        for trace_id in list(self._traces):
+            if self.nbytes + nbytes <= self.max_bytes:
+                break
+            if self._traces[trace_id] is not keep:
+                self._drop(trace_id)
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.ttl
+        for trace_id, trace in list(self._traces.items()):
+            if trace.last_access >= cutoff:
+                break
+            self._drop(trace_id)
+
+    def _drop(self, trace_id: str):
+        trace = self._traces.pop(trace_id)
+        self.nbytes -= trace.nbytes
+        if trace.source is not None:
+            # Still generating: whoever is draining or paging it must hear
+            # that it ends here because it was evicted, not because it's done.
+            trace.error = "Trace evicted before it finished: the server ran short of trace memory."
+            trace.truncated = True
+        trace.source = None  # let the suspended simulator be collected
+
+
+TRACES = TraceStore(shared_dir=SHARED_DIR)
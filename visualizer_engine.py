@@ -1,168 +1,328 @@
-from typing import List, Dict, Any
+import functools
+import importlib
+import math
+from collections import deque
+from typing import List, Dict, Any, Callable, Optional
 
+import trace_codec
+
+# ==============================
+# ALGORITHM REGISTRY
+# ==============================
+
+class Algorithm:
+    """One visualizable algorithm: its simulator, input schema, code parser
+    and step estimate, looked up by id."""
+
+    __slots__ = ("id", "simulator", "target", "args", "schema", "estimate", "steps", "max_steps",
+                 "parser", "frames")
+
+    def __init__(self, alg_id: str):
+        self.id = alg_id
+        self.simulator = None  # generator function, once imported
+        self.target = None     # "module:function" of a lazily imported simulator
+        self.args = None       # request input -> simulator positional args
+        self.schema = None     # JSON-schema-style description of the input
+        self.estimate = None   # request input -> expected number of steps
+        self.steps = None      # how that number grows with the input, for people
+        self.max_steps = None  # this simulator's own cap on the step budget, if any
+        self.parser = None     # (code, default input) -> input, see code_parsers
+        self.frames = False    # simulator yields trace_codec frames rather than full steps
+
+    @property
+    def loaded(self) -> bool:
+        return self.simulator is not None
+
+    def resolve(self) -> Callable:
+        if self.simulator is None:
+            module, _, name = self.target.partition(":")
+            self.simulator = getattr(importlib.import_module(module), name)
+        return self.simulator
+
+    def _run(self, data: Any):
+        simulator = self.resolve()
+        return simulator(*self.args(data)) if self.args else simulator(data)
+
+    def start(self, data: Any):
+        """Full steps for request input `data`."""
+        steps = self._run(data)
+        return trace_codec.decode(steps) if self.frames else steps
+
+    def start_frames(self, data: Any):
+        """Delta frames for request input `data` (see trace_codec)."""
+        steps = self._run(data)
+        return steps if self.frames else trace_codec.encode(steps)
+
+    def estimate_steps(self, data: Any) -> Optional[int]:
+        if self.estimate is None:
+            return None
+        try:
+            return self.estimate(data)
+        except Exception:
+            return None
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "input": self.schema,
+            "parses_code": self.parser is not None,
+            "estimates_steps": self.estimate is not None,
+            "estimate": self.steps,
+            "loaded": self.loaded,
+        }
+
+REGISTRY: Dict[str, Algorithm] = {}
+
+def _entry(alg_id: str) -> Algorithm:
+    entry = REGISTRY.get(alg_id)
+    if entry is None:
+        entry = REGISTRY[alg_id] = Algorithm(alg_id)
+    return entry
+
+def register(alg_id: str, *, args: Callable = None, schema: Dict = None, estimate: Callable = None,
+             steps: str = None, max_steps: int = None, frames: bool = False):
+    """Decorator registering a simulator under `alg_id`.
+
+    `args` turns the request input into the simulator's arguments; without it
+    the input is passed as the only argument. `estimate` gives the expected
+    step count for an input and `steps` says in words how it grows.
+    `max_steps` caps the step budget below the global limit for simulators
+    whose steps are expensive. With `frames` the simulator yields
+    trace_codec frames instead of full steps.
+    """
+    def decorate(fn):
+        entry = _entry(alg_id)
+        entry.simulator = fn
+        _configure(entry, args, schema, estimate, steps, max_steps, frames)
+        return fn
+    return decorate
+
+def register_lazy(alg_id: str, target: str, *, args: Callable = None, schema: Dict = None,
+                  estimate: Callable = None, steps: str = None, max_steps: int = None, frames: bool = False):
+    """Register a simulator by "module:function"; the module is imported on first use."""
+    entry = _entry(alg_id)
+    entry.target = target
+    _configure(entry, args, schema, estimate, steps, max_steps, frames)
+
+def _configure(entry: Algorithm, args, schema, estimate, steps, max_steps, frames):
+    entry.args, entry.schema, entry.estimate, entry.steps = args, schema, estimate, steps
+    entry.max_steps, entry.frames = max_steps, frames
+
+def parser(*alg_ids: str):
+    """Decorator registering a code parser for each of `alg_ids`."""
+    def decorate(fn):
+        for alg_id in alg_ids:
+            _entry(alg_id).parser = fn
+        return fn
+    return decorate
+
+def get(alg_id: str) -> Optional[Algorithm]:
+    """The registered algorithm for `alg_id`, or None if there isn't a simulator for it."""
+    entry = REGISTRY.get(alg_id)
+    if entry is None or (entry.simulator is None and entry.target is None):
+        return None
+    return entry
+
+def algorithms() -> List[Algorithm]:
+    return [entry for entry in REGISTRY.values() if entry.simulator is not None or entry.target is not None]
+
+def _int_array():
+    return {"type": "array", "items": {"type": "integer"}}
+
+def _object(**properties):
+    return {"type": "object", "properties": properties, "required": list(properties)}
+
+def _ops(*actions):
+    return {"type": "array", "items": _object(action={"enum": list(actions)}, value={})}
+
+INT = {"type": "integer"}
+def _graph(**options):
+    """Schema of a graph input: adjacency lists and/or an edge list, plus `options`."""
+    return {
+        "type": "object",
+        "properties": dict(adj={"type": "object", "additionalProperties": {"type": "array"}},
+                           edges={"type": "array", "items": {"type": "array", "minItems": 2}},
+                           directed={"type": "boolean"}, start={}, **options),
+        "required": ["start"],
+    }
+
+def _graph_args(option: str, default: str):
+    """Request input -> (adj, start, `option`, edges, directed) for the graph_engine simulators."""
+    return lambda d: (d.get("adj") or {}, d["start"], d.get(option, default), d.get("edges") or (),
+                      d.get("directed", True))
+
+# ==============================
+# SIMULATORS
+# ==============================
+
+# Every step of the sorting simulators carries a copy of the whole array.
+SORT_MAX_STEPS = 50_000
+
+@register("bubble_sort", schema=_int_array(),
+          estimate=lambda d: 2 + len(d) * (len(d) - 1) // 2 + _inversions(d),
+          steps="n(n - 1)/2 comparisons + a swap per inversion + 2", max_steps=SORT_MAX_STEPS)
 def simulate_bubble_sort(arr: List[int]):
-    steps = []
     n = len(arr)
     temp_arr = list(arr)
     
     # Initial state
-    steps.append({
+    yield {
         "line": 1,
         "variables": {"i": 0, "j": 0, "swapped": "False"},
         "array": list(temp_arr),
         "pointers": {},
         "stack": [],
         "explanation": "Starting Bubble Sort"
-    })
+    }
     
     for i in range(n):
         swapped = False
         for j in range(0, n - i - 1):
-            steps.append({
+            yield {
                 "line": 4, 
                 "variables": {"i": i, "j": j, "swapped": str(swapped)},
                 "array": list(temp_arr),
                 "pointers": {"j": j, "j+1": j+1},
                 "stack": [],
                 "explanation": f"Comparing {temp_arr[j]} and {temp_arr[j+1]}"
-            })
+            }
             
             if temp_arr[j] > temp_arr[j+1]:
                 temp_arr[j], temp_arr[j+1] = temp_arr[j+1], temp_arr[j]
                 swapped = True
-                steps.append({
+                yield {
                     "line": 6,
                     "variables": {"i": i, "j": j, "swapped": str(swapped)},
                     "array": list(temp_arr),
                     "pointers": {"j": j, "j+1": j+1},
                     "stack": [],
                     "explanation": f"Swapping {temp_arr[j+1]} and {temp_arr[j]}"
-                })
+                }
         if not swapped:
             break
             
-    steps.append({
+    yield {
         "line": 10,
         "variables": {"i": n, "swapped": str(swapped)},
         "array": list(temp_arr),
         "pointers": {},
         "stack": [],
         "explanation": "Sort complete!"
-    })
-    return steps
+    }
 
+@register("binary_search", args=lambda d: (d["arr"], d["target"]),
+          schema=_object(arr=_int_array(), target=INT),
+          estimate=lambda d: 2 + 2 * len(d["arr"]).bit_length(), steps="at most 2 per halving + 2")
 def simulate_binary_search(arr: List[int], target: int):
-    steps = []
     arr = sorted(arr)
     low = 0
     high = len(arr) - 1
     
-    steps.append({
+    yield {
         "line": 1,
         "variables": {"low": low, "high": high, "target": target},
         "array": list(arr),
         "pointers": {"low": low, "high": high},
         "stack": [],
         "explanation": f"Starting binary search for {target}"
-    })
+    }
     
     while low <= high:
         mid = (low + high) // 2
-        steps.append({
+        yield {
             "line": 4,
             "variables": {"low": low, "high": high, "mid": mid, "target": target},
             "array": list(arr),
             "pointers": {"low": low, "high": high, "mid": mid},
             "stack": [],
             "explanation": f"Checking mid element {arr[mid]}"
-        })
+        }
         
         if arr[mid] == target:
-            steps.append({
+            yield {
                 "line": 6,
                 "variables": {"low": low, "high": high, "mid": mid, "target": target},
                 "array": list(arr),
                 "pointers": {"mid": mid},
                 "stack": [],
                 "explanation": f"Target {target} found at index {mid}!"
-            })
-            return steps
+            }
+            return
         elif arr[mid] < target:
             low = mid + 1
-            steps.append({
+            yield {
                 "line": 8,
                 "variables": {"low": low, "high": high, "mid": mid, "target": target},
                 "array": list(arr),
                 "pointers": {"low": low, "high": high},
                 "stack": [],
                 "explanation": f"{arr[mid]} < {target}, moving low to {low}"
-            })
+            }
         else:
             high = mid - 1
-            steps.append({
+            yield {
                 "line": 10,
                 "variables": {"low": low, "high": high, "mid": mid, "target": target},
                 "array": list(arr),
                 "pointers": {"low": low, "high": high},
                 "stack": [],
                 "explanation": f"{arr[mid]} > {target}, moving high to {high}"
-            })
+            }
             
-    steps.append({
+    yield {
         "line": 12,
         "variables": {"low": low, "high": high, "target": target},
         "array": list(arr),
         "pointers": {},
         "stack": [],
         "explanation": f"Target {target} not found."
-    })
-    return steps
+    }
 
+@register("factorial", args=lambda d: (_factorial_n(d),), schema=INT,
+          estimate=lambda d: 2 * max(_factorial_n(d), 1), steps="2n")
 def simulate_factorial(n: int):
-    steps = []
     
     def fact(val, stack_frames):
         # Push frame
         current_stack = list(stack_frames)
         current_stack.append(f"fact({val})")
         
-        steps.append({
+        yield {
             "line": 1,
             "variables": {"n": val},
             "array": [],
             "pointers": {},
             "stack": list(current_stack),
             "explanation": f"Calling factorial({val})"
-        })
+        }
         
         if val <= 1:
-            steps.append({
+            yield {
                 "line": 3,
                 "variables": {"n": val, "return": 1},
                 "array": [],
                 "pointers": {},
                 "stack": list(current_stack),
                 "explanation": f"Base case fact({val}) returns 1"
-            })
+            }
             return 1
         
-        res = val * fact(val - 1, current_stack)
+        res = val * (yield from fact(val - 1, current_stack))
         
-        steps.append({
+        yield {
             "line": 5,
             "variables": {"n": val, "return": res},
             "array": [],
             "pointers": {},
             "stack": list(current_stack),
             "explanation": f"Factorial({val}) returning {res}"
-        })
+        }
         return res
         
-    fact(n, [])
-    return steps
+    yield from fact(n, [])
 
+@register("stack", schema=_ops("push", "pop"), estimate=len, steps="one per operation")
 def simulate_stack(ops: List[Dict]):
-    steps = []
     stack_data = []
     
     for i, op in enumerate(ops):
@@ -179,196 +339,172 @@ def simulate_stack(ops: List[Dict]):
             else:
                 explanation = "Stack underflow!"
         
-        steps.append({
+        yield {
             "line": i + 1,
             "variables": {"action": action, "value": val, "size": len(stack_data)},
             "array": list(stack_data),
             "pointers": {"top": len(stack_data) - 1 if stack_data else -1},
             "stack": [],
             "explanation": explanation
-        })
-    return steps
+        }
 
-def simulate_dfs(adj_list, start):
-    steps = []
-    visited = set()
-    stack = [start]
-    
-    steps.append({
-        "line": 1,
-        "variables": {"current": None, "stack": str(stack)},
-        "array": sorted(list(visited)), # show visited set
-        "pointers": {"start": start},
-        "stack": list(stack),
-        "explanation": f"Starting DFS from {start}"
-    })
-    
-    while stack:
-        curr = stack.pop()
-        explanation = f"Popped {curr} from stack"
-        
-        if curr not in visited:
-            visited.add(curr)
-            explanation += f", exploring it now"
-            
-            # For visualization, we'll show neighbors being pushed
-            neighbors = adj_list.get(str(curr), [])
-            for neighbor in neighbors:
-                if neighbor not in visited:
-                    stack.append(neighbor)
-                    
-            steps.append({
-                "line": 5,
-                "variables": {"current": curr, "visited": str(visited)},
-                "array": list(visited),
-                "pointers": {"current": curr},
-                "stack": list(stack),
-                "explanation": explanation
-            })
-    
-    steps.append({
-        "line": 10,
-        "variables": {},
-        "array": list(visited),
-        "pointers": {},
-        "stack": [],
-        "explanation": "DFS complete!"
-    })
-    return steps
+register_lazy("dfs", "graph_engine:simulate_dfs", frames=True, args=_graph_args("events", "both"),
+              schema=_graph(events={"enum": ["both", "pre", "post"]}),
+              estimate=lambda d: 2 + _graph_nodes(d) * (2 if d.get("events", "both") == "both" else 1),
+              steps="one per node and event + 2")
+
+# Circular buffers are shown whole, so their size is capped: at this many
+# slots, or one per operation when there are more (more slots than
+# operations would only ever show empty ones).
+QUEUE_MAX_CAPACITY = 1024
+
+def queue_capacity_limit(ops: List[Dict]) -> int:
+    return max(len(ops), QUEUE_MAX_CAPACITY)
+
+def _queue_args(data):
+    if isinstance(data, dict):
+        return data.get("ops") or [], data.get("capacity")
+    return data, None
+
+@register("queue", args=_queue_args, frames=True,
+          schema={"oneOf": [_ops("enqueue", "dequeue"), _object(ops=_ops("enqueue", "dequeue"), capacity=INT)]},
+          estimate=lambda d: len(_queue_args(d)[0]), steps="one per operation")
+def simulate_queue(ops: List[Dict], capacity: int = None):
+    """Queue operations as delta frames; each step carries only the slot that
+    changed, so a long operation script stays linear.
+
+    Without `capacity` the queue is shown front to rear. With it, the queue is
+    a circular buffer of that many slots, shown whole so head and tail can be
+    seen wrapping around.
+    """
+    if capacity is not None and not 1 <= capacity <= queue_capacity_limit(ops):
+        raise ValueError(f"Queue capacity must be between 1 and {queue_capacity_limit(ops)}")
+    queue_data = deque()
+    buffer = [None] * capacity if capacity else None
+    head = tail = 0
+    framer = trace_codec.Framer()
 
-def simulate_queue(ops: List[Dict]):
-    steps = []
-    queue_data = []
-    
     for i, op in enumerate(ops):
         action = op.get("action")
         val = op.get("value")
-        
+        change = None
+
         if action == "enqueue":
-            queue_data.append(val)
-            explanation = f"Enqueued {val} to queue"
+            if buffer is None:
+                queue_data.append(val)
+                change = trace_codec.appended(len(queue_data) - 1, [val])
+                explanation = f"Enqueued {val} to queue"
+            elif len(queue_data) == capacity:
+                explanation = f"Queue overflow! All {capacity} slots are taken"
+            else:
+                queue_data.append(val)
+                buffer[tail] = val
+                change = {"set": [[tail, val]]}
+                explanation = f"Enqueued {val} at slot {tail}"
+                tail = (tail + 1) % capacity
+                if tail == 0:
+                    explanation += ", tail wraps around to slot 0"
         elif action == "dequeue":
-            if queue_data:
-                dequeued = queue_data.pop(0)
+            if not queue_data:
+                explanation = "Queue underflow!"
+            elif buffer is None:
+                dequeued = queue_data.popleft()
+                change = {"shift": 1}
                 explanation = f"Dequeued {dequeued} from queue"
             else:
-                explanation = "Queue underflow!"
-        
-        steps.append({
+                dequeued = queue_data.popleft()
+                buffer[head] = None
+                change = {"set": [[head, None]]}
+                explanation = f"Dequeued {dequeued} from slot {head}"
+                head = (head + 1) % capacity
+                if head == 0:
+                    explanation += ", head wraps around to slot 0"
+        else:
+            explanation = f"Unknown operation '{action}'"
+
+        size = len(queue_data)
+        variables = {"action": action, "value": val, "size": size}
+        if buffer is None:
+            pointers = {"front": 0 if size else -1, "rear": size - 1 if size else -1}
+        else:
+            variables["capacity"] = capacity
+            pointers = {"front": head if size else -1, "rear": (tail - 1) % capacity if size else -1}
+        yield framer.frame({
             "line": i + 1,
-            "variables": {"action": action, "value": val, "size": len(queue_data)},
-            "array": list(queue_data),
-            "pointers": {"front": 0 if queue_data else -1, "rear": len(queue_data) - 1 if queue_data else -1},
-            "stack": [],
+            "variables": variables,
+            "array": queue_data if buffer is None else buffer,
+            "pointers": pointers,
             "explanation": explanation
-        })
-    return steps
+        }, array=change)
 
+@register("insertion_sort", schema=_int_array(),
+          estimate=lambda d: 2 + 2 * max(len(d) - 1, 0) + _inversions(d),
+          steps="2(n - 1) + a shift per inversion + 2", max_steps=SORT_MAX_STEPS)
 def simulate_insertion_sort(arr: List[int]):
-    steps = []
     n = len(arr)
     temp_arr = list(arr)
     
-    steps.append({
+    yield {
         "line": 1,
         "variables": {"i": 1},
         "array": list(temp_arr),
         "pointers": {},
         "stack": [],
         "explanation": "Starting Insertion Sort"
-    })
+    }
     
     for i in range(1, n):
         key = temp_arr[i]
         j = i - 1
-        steps.append({
+        yield {
             "line": 3,
             "variables": {"i": i, "key": key},
             "array": list(temp_arr),
             "pointers": {"i": i, "key": i},
             "stack": [],
             "explanation": f"Picking {key} as key"
-        })
+        }
         
         while j >= 0 and temp_arr[j] > key:
-            steps.append({
+            yield {
                 "line": 5,
                 "variables": {"i": i, "key": key, "j": j},
                 "array": list(temp_arr),
                 "pointers": {"j": j, "key": i},
                 "stack": [],
                 "explanation": f"{temp_arr[j]} > {key}, shifting {temp_arr[j]}"
-            })
+            }
             temp_arr[j + 1] = temp_arr[j]
             j -= 1
             
         temp_arr[j + 1] = key
-        steps.append({
+        yield {
             "line": 8,
             "variables": {"i": i, "key": key, "j": j},
             "array": list(temp_arr),
             "pointers": {"j+1": j+1},
             "stack": [],
             "explanation": f"Placed key {key} at index {j+1}"
-        })
+        }
         
-    steps.append({
+    yield {
         "line": 10,
         "variables": {},
         "array": list(temp_arr),
         "pointers": {},
         "stack": [],
         "explanation": "Insertion sort complete!"
-    })
-    return steps
+    }
 
-def simulate_bfs(adj_list, start):
-    steps = []
-    visited = {str(start)}
-    queue = [str(start)]
-    
-    steps.append({
-        "line": 1,
-        "variables": {"queue": str(queue), "visited": str(visited)},
-        "array": sorted(list(visited)),
-        "pointers": {"front": 0, "rear": 0},
-        "stack": [],
-        "explanation": f"Starting BFS from {start}"
-    })
-    
-    while queue:
-        curr = queue.pop(0)
-        explanation = f"Dequeued {curr} from queue"
-        
-        # Neighbor exploration
-        neighbors = adj_list.get(str(curr), [])
-        for neighbor in neighbors:
-            if str(neighbor) not in visited:
-                visited.add(str(neighbor))
-                queue.append(str(neighbor))
-                explanation += f", neighbor {neighbor} discovered"
-                
-        steps.append({
-            "line": 5,
-            "variables": {"current": curr, "queue": str(queue)},
-            "array": sorted(list(visited)),
-            "pointers": {"current": curr},
-            "stack": [],
-            "explanation": explanation
-        })
-                
-    steps.append({
-        "line": 10,
-        "variables": {},
-        "array": sorted(list(visited)),
-        "pointers": {},
-        "stack": [],
-        "explanation": "BFS complete!"
-    })
-    return steps
+register_lazy("bfs", "graph_engine:simulate_bfs", frames=True, args=_graph_args("granularity", "node"),
+              schema=_graph(granularity={"enum": ["node", "level"]}),
+              estimate=lambda d: 2 + _graph_nodes(d), steps="at most one per node + 2")
 
+@register("arrays", args=lambda d: (d["arr"], d["ops"]),
+          schema=_object(arr=_int_array(), ops={"type": "array", "items": _object(action={"enum": ["access", "update", "search"]}, index=INT, value=INT)}),
+          estimate=lambda d: sum(1 + (len(d["arr"]) if op.get("action") == "search" else 0) for op in d["ops"]),
+          steps="one per operation + n per search")
 def simulate_arrays(arr: List[int], ops: List[Dict]):
-    steps = []
     current_arr = list(arr)
     
     for i, op in enumerate(ops):
@@ -386,76 +522,76 @@ def simulate_arrays(arr: List[int], ops: List[Dict]):
         elif action == "search":
             found_idx = -1
             for j, v in enumerate(current_arr):
-                steps.append({
+                yield {
                     "line": 4, "variables": {"target": val, "curr": v, "i": j},
                     "array": list(current_arr), "pointers": {"searching": j},
                     "explanation": f"Checking if {v} == {val}"
-                })
+                }
                 if v == val:
                     found_idx = j
                     break
             explanation = f"Searching for {val}: Found at {found_idx}" if found_idx != -1 else f"{val} not found"
             
-        steps.append({
+        yield {
             "line": 2, "variables": {"action": action, "idx": idx, "val": val},
             "array": list(current_arr), "pointers": {"active": idx} if action != "search" else {},
             "explanation": explanation
-        })
-    return steps
+        }
 
+@register("strings", args=lambda d: (d["s"], d["action"]),
+          schema=_object(s={"type": "string"}, action={"enum": ["reverse", "palindrome"]}),
+          estimate=lambda d: len(d["s"]) // 2 + 1, steps="n/2 + 1")
 def simulate_strings(s: str, action: str):
-    steps = []
     chars = list(s)
     
     if action == "reverse":
         left, right = 0, len(chars) - 1
         while left < right:
-            steps.append({
+            yield {
                 "line": 3, "variables": {"l": left, "r": right, "leftChar": chars[left], "rightChar": chars[right]},
                 "array": list(chars), "pointers": {"left": left, "right": right},
                 "explanation": f"Swapping {chars[left]} and {chars[right]}"
-            })
+            }
             chars[left], chars[right] = chars[right], chars[left]
             left += 1
             right -= 1
-        steps.append({
+        yield {
             "line": 10, "variables": {"result": "".join(chars)},
             "array": list(chars), "pointers": {},
             "explanation": f"String reversal complete: {''.join(chars)}"
-        })
+        }
     elif action == "palindrome":
         left, right = 0, len(chars) - 1
         is_pal = True
         while left < right:
-            steps.append({
+            yield {
                 "line": 3, "variables": {"l": left, "r": right},
                 "array": list(chars), "pointers": {"checkL": left, "checkR": right},
                 "explanation": f"Comparing {chars[left]} and {chars[right]}"
-            })
+            }
             if chars[left] != chars[right]:
                 is_pal = False
                 break
             left += 1
             right -= 1
-        steps.append({
+        yield {
             "line": 10, "variables": {"isPalindrome": is_pal},
             "array": list(chars), "pointers": {},
             "explanation": f"Palindrome check result: {is_pal}"
-        })
-    return steps
+        }
 
+@register("backtracking", schema=INT)
 def simulate_backtracking(n: int):
     # Simulate N-Queens setup for n x n board
-    # Simplified: Show placement steps for the first few queens
-    steps = []
+    # Runs until the first solution; the caller's step budget bounds the trace
     board = [-1] * n # board[row] = col
     
     def solve(row):
         if row == n:
-            steps.append({
+            yield {
                 "line": 10, "variables": {"row": row}, "array": list(board),
                 "pointers": {}, "explanation": "Found a valid solution!"
-            })
+            }
             return True
         
         for col in range(n):
@@ -467,66 +603,68 @@ def simulate_backtracking(n: int):
                     break
             
             board[row] = col
-            steps.append({
+            yield {
                 "line": 5, "variables": {"row": row, "col": col, "valid": is_valid},
                 "array": list(board), "pointers": {"current": row},
                 "explanation": f"Trying to place Queen at row {row}, col {col}... {'Valid' if is_valid else 'Conflict'}"
-            })
+            }
             
             if is_valid:
-                if solve(row + 1): return True
+                if (yield from solve(row + 1)): return True
             
             board[row] = -1 # backtrack
             if not is_valid: # Only show explicit backtrack for conflicts or after a fail
-                 steps.append({
+                 yield {
                     "line": 8, "variables": {"row": row, "col": col},
                     "array": list(board), "pointers": {"backtrack": row},
                     "explanation": f"Backtracking from row {row}, col {col}"
-                })
+                }
         return False
 
-    solve(0)
-    return steps[:50] # Limit steps
+    yield from solve(0)
 
+@register("heap", args=lambda d: (d["arr"], d["action"], d["val"]),
+          schema=_object(arr=_int_array(), action={"enum": ["insert", "extract"]}, val={"type": ["integer", "null"]}),
+          estimate=lambda d: 2 + len(d["arr"]).bit_length() if d["action"] == "insert" else 2,
+          steps="log2(n) + 2 to insert, 2 to extract")
 def simulate_heap(arr: List[int], action: str, val: int = None):
-    steps = []
     heap = list(arr)
     
     if action == "insert":
         heap.append(val)
         curr = len(heap) - 1
-        steps.append({
+        yield {
             "line": 2, "variables": {"val": val}, "array": list(heap),
             "pointers": {"inserted": curr}, "explanation": f"Inserted {val} at index {curr}"
-        })
+        }
         
         while curr > 0:
             parent = (curr - 1) // 2
-            steps.append({
+            yield {
                 "line": 5, "variables": {"curr": heap[curr], "parent": heap[parent]},
                 "array": list(heap), "pointers": {"curr": curr, "parent": parent},
                 "explanation": f"Checking if {heap[curr]} > parent {heap[parent]}"
-            })
+            }
             if heap[curr] > heap[parent]:
                 heap[curr], heap[parent] = heap[parent], heap[curr]
                 curr = parent
             else:
                 break
-        steps.append({
+        yield {
             "line": 10, "variables": {}, "array": list(heap),
             "pointers": {}, "explanation": "Heapify complete"
-        })
+        }
     elif action == "extract":
-        if not heap: return steps
+        if not heap: return
         root = heap[0]
         last = heap.pop()
         if heap:
             heap[0] = last
-            steps.append({
+            yield {
                 "line": 2, "variables": {"root": root, "new_top": last},
                 "array": list(heap), "pointers": {"root": 0},
                 "explanation": f"Extracted {root}, moved {last} to root"
-            })
+            }
             # Sift down (simplified)
             curr = 0
             while True:
@@ -541,103 +679,302 @@ def simulate_heap(arr: List[int], action: str, val: int = None):
                     curr = largest
                 else: break
         explanation = f"Extracted {root}"
-        steps.append({ "line": 10, "array": list(heap), "explanation": explanation })
+        yield { "line": 10, "array": list(heap), "explanation": explanation }
         
-    return steps
 
+@register("hashing", args=lambda d: (d["keys"], d["size"]),
+          schema=_object(keys=_int_array(), size=INT),
+          estimate=lambda d: 2 * len(d["keys"]) + _hash_probes(d["keys"], d["size"]),
+          steps="2 per key + one per probe")
 def simulate_hashing(keys: List[int], size: int = 7):
-    steps = []
     table = [None] * size
     
     for key in keys:
         h = key % size
-        steps.append({
+        yield {
             "line": 2, "variables": {"key": key, "hash": h}, "array": list(table),
             "pointers": {"target": h}, "explanation": f"Key {key} hashes to index {h}"
-        })
+        }
         
         # Linear probing for collision
         curr = h
         while table[curr] is not None:
-             steps.append({
+             yield {
                 "line": 5, "variables": {"collisionAt": curr}, "array": list(table),
                 "pointers": {"collision": curr}, "explanation": f"Collision at {curr}, probing next..."
-            })
+            }
              curr = (curr + 1) % size
              
         table[curr] = key
-        steps.append({
+        yield {
             "line": 8, "variables": {"placedAt": curr}, "array": list(table),
             "pointers": {"placed": curr}, "explanation": f"Placed {key} at index {curr}"
-        })
-    return steps
+        }
 
+@register("linked_lists", args=lambda d: (d["arr"], d["action"], d["val"], d["pos"]),
+          schema=_object(arr=_int_array(), action={"enum": ["insert", "delete"]}, val=INT, pos=INT),
+          estimate=lambda d: 1, steps="1")
 def simulate_linked_list(arr: List[int], action: str, val: int = None, pos: int = 0):
-    steps = []
     nodes = list(arr)
     
     if action == "insert":
         nodes.insert(pos, val)
-        steps.append({
+        yield {
             "line": 2, "variables": {"val": val, "pos": pos}, "array": list(nodes),
             "pointers": {"new_node": pos}, "explanation": f"Inserted {val} at position {pos}"
-        })
+        }
     elif action == "delete":
         if 0 <= pos < len(nodes):
             old = nodes.pop(pos)
-            steps.append({
+            yield {
                 "line": 2, "variables": {"old": old, "pos": pos}, "array": list(nodes),
                 "pointers": {"deleted_at": pos}, "explanation": f"Deleted value {old} at position {pos}"
-            })
-    return steps
+            }
 
+@register("greedy_algorithms", args=lambda d: (d["amount"], d["coins"]), frames=True,
+          schema=_object(amount=INT, coins=_int_array()),
+          estimate=lambda d: _greedy_steps(d["amount"], d["coins"]), steps="one per coin denomination and coin taken + 1")
 def simulate_greedy(amount: int, coins: List[int]):
-    steps = []
+    """Greedy coin change, as delta frames; a step sends only the coin it
+    took, so the trace stays linear in the coins taken."""
     coins = sorted(coins, reverse=True)
     res = []
     curr = amount
+    framer = trace_codec.Framer()
     
     for c in coins:
         count = curr // c
-        steps.append({
+        yield framer.frame({
             "line": 4, "variables": {"coin": c, "left": curr, "taken": count},
-            "array": list(res), "pointers": {},
+            "array": res, "pointers": {},
             "explanation": f"Checking coin {c}. We can take {count} coins."
         })
         if count > 0:
             for _ in range(count):
                 res.append(c)
                 curr -= c
-                steps.append({
+                yield framer.frame({
                     "line": 8, "variables": {"amountLeft": curr},
-                    "array": list(res), "pointers": {},
+                    "array": res, "pointers": {},
                     "explanation": f"Added {c} to result. Remaining: {curr}"
+                }, array=trace_codec.appended(len(res) - 1, [c]))
+    yield framer.frame({ "line": 15, "array": res, "explanation": "Greedy selection complete!" })
+
+DP_MODES = ("memo", "tabulation", "rolling")
+# Largest n simulated; no step budget comes close to showing more of it.
+DP_MAX_N = 1_000_000
+# Longest str() of an int made in one go, under Python's 4300-digit limit.
+STR_DIGITS = 4000
+LOG10_2 = math.log10(2)
+
+def _dp_args(data):
+    if isinstance(data, dict):
+        return int(data["n"]), data.get("mode", "memo")
+    return int(data), "memo"
+
+@functools.lru_cache(maxsize=16)
+def _pow10(k: int) -> int:
+    return 10 ** k
+
+def _digit_count(value: int) -> int:
+    """Decimal digits in `value` > 0, from its bit length (no str())."""
+    count = int((value.bit_length() - 1) * LOG10_2) + 1
+    if value >= _pow10(count):
+        count += 1
+    elif value < _pow10(count - 1):
+        count -= 1
+    return count
+
+def _decimal(value: int) -> str:
+    """str(value) for `value` >= 0 of any size, converted in halves so no
+    single str() call meets the interpreter's int-to-str digit limit."""
+    count = _digit_count(value) if value else 1
+    if count <= STR_DIGITS:
+        return str(value)
+    half = count // 2
+    high, low = divmod(value, _pow10(half))
+    return _decimal(high) + _decimal(low).zfill(half)
+
+def _js_int(value: int, exact: bool = False):
+    """`value` as JSON a browser reads back unchanged: a number up to 2^53,
+    a string past that, abbreviated when long unless `exact`."""
+    if -2**53 <= value <= 2**53:
+        return value
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    if exact:
+        return sign + _decimal(value)
+    count = _digit_count(value)
+    if count <= 30:
+        return sign + str(value)
+    head = value // _pow10(count - 12)
+    tail = value % _pow10(12)
+    return f"{sign}{head}...{tail:012d} ({count} digits)"
+
+@register("dynamic_programming", args=_dp_args, frames=True,
+          schema={"oneOf": [INT, _object(n=INT, mode={"enum": list(DP_MODES)})]},
+          estimate=lambda d: _dp_steps(*_dp_args(d)), steps="memo 3n - 1, tabulation n + 2, rolling n + 1")
+def simulate_dp(n: int, mode: str = "memo"):
+    """Fibonacci by dynamic programming, as delta frames.
+
+    "memo" is top-down recursion with a memo table (run on an explicit call
+    stack, so deep n doesn't hit the recursion limit) and shows memo hits;
+    "tabulation" fills the table bottom-up; "rolling" keeps only the last
+    two values. Every step touches O(1) cells, so the trace is linear in n.
+    Tables grow as cells are filled rather than being allocated up front,
+    so a run cut short by its step budget costs only what it showed.
+    """
+    if mode not in DP_MODES:
+        raise ValueError(f"mode must be one of {', '.join(DP_MODES)}")
+    if not 0 <= n <= DP_MAX_N:
+        raise ValueError(f"n must be between 0 and {DP_MAX_N}")
+    framer = trace_codec.Framer()
+    if mode == "memo":
+        result, summary = yield from _dp_memo(n, framer)
+    elif mode == "tabulation":
+        result, summary = yield from _dp_tabulation(n, framer)
+    else:
+        result, summary = yield from _dp_rolling(n, framer)
+    yield framer.frame({
+        "line": 10,
+        "variables": dict(summary, n=n, result=_js_int(result, exact=True)),
+        "pointers": {},
+        "explanation": f"fib({n}) = {_js_int(result)}"
+    })
+
+def _dp_cell(cells: list, i: int, value):
+    """Set cells[i], padding with nulls up to it (as a delta "set" does)."""
+    if i >= len(cells):
+        cells.extend([None] * (i + 1 - len(cells)))
+    cells[i] = value
+
+def _dp_memo(n: int, framer):
+    memo = {}
+    shown = []  # memo as sent, up to the highest index stored so far
+    calls = []    # i of each active fib(i) call
+    returned = [] # per active call, the values its sub-calls returned
+    labels = []   # call stack as shown
+    hits = 0
+    todo, value = n, None  # next call to make (None: `value` was just returned)
+
+    while True:
+        if todo is not None:
+            i, todo = todo, None
+            if i in memo:
+                hits += 1
+                value = memo[i]
+                yield framer.frame({
+                    "line": 3,
+                    "variables": {"n": i, "event": "memo_hit", "value": shown[i], "depth": len(calls)},
+                    "array": shown, "stack": labels,
+                    "pointers": {"hit": i},
+                    "explanation": f"Memo hit: fib({i}) = {shown[i]} is already stored"
                 })
-    steps.append({ "line": 15, "array": list(res), "explanation": "Greedy selection complete!" })
-    return steps
+            elif i <= 1:
+                memo[i] = value = i
+                _dp_cell(shown, i, i)
+                yield framer.frame({
+                    "line": 2,
+                    "variables": {"n": i, "event": "base", "value": i, "depth": len(calls)},
+                    "array": shown, "stack": labels,
+                    "pointers": {"filled": i},
+                    "explanation": f"Base case: fib({i}) = {i}"
+                }, array={"set": [[i, i]]})
+            else:
+                calls.append(i)
+                returned.append([])
+                labels.append(f"fib({i})")
+                yield framer.frame({
+                    "line": 4,
+                    "variables": {"n": i, "event": "call", "value": None, "depth": len(calls)},
+                    "array": shown, "stack": labels,
+                    "pointers": {"current": i},
+                    "explanation": f"Calculating fib({i}) = fib({i - 1}) + fib({i - 2})..."
+                }, stack=trace_codec.appended(len(labels) - 1, labels[-1:]))
+                todo = i - 1
+                continue
 
-def simulate_dp(n: int):
-    # Simulate Fibonacci with memoization
-    steps = []
-    memo = [0] * (n + 1)
-    
-    def fib(i):
-        if i <= 1: 
-            memo[i] = i
-            steps.append({ "line": 2, "variables": {"n": i, "val": i}, "array": list(memo), "explanation": f"Base case: fib({i}) = {i}" })
-            return i
-        
-        steps.append({ "line": 4, "variables": {"n": i}, "array": list(memo), "explanation": f"Calculating fib({i})..." })
-        res = fib(i-1) + fib(i-2)
-        memo[i] = res
-        steps.append({ "line": 8, "variables": {"n": i, "result": res}, "array": list(memo), "pointers": {"filled": i}, "explanation": f"fib({i}) stored as {res}" })
-        return res
+        # `value` goes back to the call that made it
+        if not calls:
+            break
+        i = calls[-1]
+        returned[-1].append(value)
+        if len(returned[-1]) == 1:
+            todo = i - 2
+            continue
+        value = memo[i] = sum(returned[-1])
+        _dp_cell(shown, i, _js_int(value))
+        calls.pop()
+        returned.pop()
+        labels.pop()
+        yield framer.frame({
+            "line": 8,
+            "variables": {"n": i, "event": "store", "value": shown[i], "depth": len(calls)},
+            "array": shown, "stack": labels,
+            "pointers": {"filled": i},
+            "explanation": f"fib({i}) stored as {shown[i]}"
+        }, array={"set": [[i, shown[i]]]}, stack={"len": len(labels)})
 
-    fib(n)
-    return steps
+    return memo[n], {"memo_hits": hits, "subproblems": n + 1}
 
+def _dp_tabulation(n: int, framer):
+    table = [0]
+    shown = [0]  # table as sent
+    yield framer.frame({
+        "line": 2,
+        "variables": {"i": 0, "value": 0},
+        "array": shown,
+        "pointers": {"i": 0},
+        "explanation": "Base case: dp[0] = 0"
+    })
+    if n >= 1:
+        table.append(1)
+        shown.append(1)
+        yield framer.frame({
+            "line": 3,
+            "variables": {"i": 1, "value": 1},
+            "array": shown,
+            "pointers": {"i": 1},
+            "explanation": "Base case: dp[1] = 1"
+        }, array={"set": [[1, 1]]})
+    for i in range(2, n + 1):
+        table.append(table[i - 1] + table[i - 2])
+        shown.append(_js_int(table[i]))
+        yield framer.frame({
+            "line": 5,
+            "variables": {"i": i, "value": shown[i]},
+            "array": shown,
+            "pointers": {"i": i, "prev1": i - 1, "prev2": i - 2},
+            "explanation": f"dp[{i}] = dp[{i - 1}] + dp[{i - 2}] = {shown[i]}"
+        }, array={"set": [[i, shown[i]]]})
+    return table[n], {"table_size": n + 1}
+
+def _dp_rolling(n: int, framer):
+    prev, cur = 0, 1  # fib(i - 1), fib(i)
+    yield framer.frame({
+        "line": 2,
+        "variables": {"i": 1, "prev": 0, "cur": 1},
+        "array": [0, 1],
+        "pointers": {"prev": 0, "cur": 1},
+        "explanation": "Start with fib(0) = 0 and fib(1) = 1; only these two values are kept"
+    })
+    shown_prev, shown_cur = 0, 1
+    for i in range(2, n + 1):
+        prev, cur = cur, prev + cur
+        dropped, shown_prev, shown_cur = shown_prev, shown_cur, _js_int(cur)
+        yield framer.frame({
+            "line": 5,
+            "variables": {"i": i, "prev": shown_prev, "cur": shown_cur},
+            "array": [shown_prev, shown_cur],
+            "pointers": {"prev": 0, "cur": 1},
+            "explanation": f"fib({i}) = {shown_prev} + {dropped} = {shown_cur}; fib({i - 2}) is dropped"
+        }, array={"set": [[0, shown_prev], [1, shown_cur]]})
+    return (prev if n == 0 else cur), {"cells": 2}
+
+@register("bit_manipulation", args=lambda d: (d["val"], d["op"], d["mask"]),
+          schema=_object(val=INT, op={"enum": ["AND", "OR", "XOR", "SHIFT"]}, mask=INT),
+          estimate=lambda d: 2, steps="2")
 def simulate_bit_manipulation(val: int, op: str, mask: int = 1):
-    steps = []
     binary = bin(val)[2:].zfill(8)
     res_val = val
     if op == "AND": res_val = val & mask
@@ -647,82 +984,259 @@ def simulate_bit_manipulation(val: int, op: str, mask: int = 1):
     
     res_bin = bin(res_val)[2:].zfill(8)
     
-    steps.append({
+    yield {
         "line": 2, "variables": {"op": op, "val": val, "mask": mask},
         "array": list(binary), "explanation": f"Input bits: {binary}"
-    })
-    steps.append({
+    }
+    yield {
         "line": 10, "variables": {"result": res_val},
         "array": list(res_bin), "explanation": f"Resulting bits: {res_bin} (Value: {res_val})"
-    })
-    return steps
+    }
 
+@register("tries", schema={"type": "array", "items": {"type": "string"}}, frames=True,
+          estimate=lambda d: sum(map(len, d)) + 1, steps="one per character + 1")
 def simulate_trie(words: List[str]):
-    steps = []
+    """Trie insertion as delta frames; the word's characters are sent once
+    per word rather than with every step."""
     # Simplified trie: show levels and current path
     trie = {"#": "ROOT"}
+    framer = trace_codec.Framer()
+    shown = []
     
     for word in words:
         curr = trie
-        for char in word:
+        for j, char in enumerate(word):
             if char not in curr: curr[char] = {}
             curr = curr[char]
-            steps.append({
+            if j == 0:
+                shown = list(word)
+            yield framer.frame({
                 "line": 5, "variables": {"word": word, "char": char},
-                "array": list(word), "pointers": {"at": word.find(char)},
+                "array": shown, "pointers": {"at": word.find(char)},
                 "explanation": f"Inserting '{char}' into the prefix path of '{word}'"
-            })
-    steps.append({ "line": 15, "explanation": "Trie insertion complete!" })
-    return steps
+            }, array={"replace": shown} if j == 0 else None)
+    yield framer.frame({ "line": 15, "explanation": "Trie insertion complete!" },
+                       array={"replace": []} if shown else None)
 
+@register("segment_trees", schema=_int_array(), frames=True,
+          estimate=lambda d: max(2 * len(d) - 1, 0), steps="2n - 1")
 def simulate_segment_tree(arr: List[int]):
-    steps = []
+    """Segment tree build as delta frames; a step sends only the node it set."""
     n = len(arr)
     tree = [0] * (2 * n)
+    framer = trace_codec.Framer()
     
     # Build
     for i in range(n):
         tree[n + i] = arr[i]
-        steps.append({
+        yield framer.frame({
             "line": 3, "variables": {"i": i, "val": arr[i]},
-            "array": list(tree), "pointers": {"leaf": n + i},
+            "array": tree, "pointers": {"leaf": n + i},
             "explanation": f"Placing {arr[i]} at leaf index {n+i}"
-        })
+        }, array={"set": [[n + i, arr[i]]]})
     
     for i in range(n - 1, 0, -1):
         tree[i] = tree[2*i] + tree[2*i + 1]
-        steps.append({
+        yield framer.frame({
             "line": 8, "variables": {"parent": i, "left": tree[2*i], "right": tree[2*i+1]},
-            "array": list(tree), "pointers": {"parent": i, "l": 2*i, "r": 2*i+1},
+            "array": tree, "pointers": {"parent": i, "l": 2*i, "r": 2*i+1},
             "explanation": f"Parent {i} = left({tree[2*i]}) + right({tree[2*i+1]}) = {tree[i]}"
-        })
-    return steps
+        }, array={"set": [[i, tree[i]]]})
 
-def simulate_dsu(n: int, ops: List[tuple]):
-    steps = []
+DSU_FINDS = ("naive", "compression", "halving")
+DSU_UNIONS = ("naive", "rank", "size")
+
+@register("disjoint_set_union", frames=True,
+          args=lambda d: (d["n"], d["ops"], d.get("find", "compression"), d.get("union", "rank")),
+          schema={"type": "object",
+                  "properties": {"n": INT,
+                                 "ops": {"type": "array", "items": {"type": "array", "items": [
+                                     {"enum": ["union", "find"]}, INT, {"type": ["integer", "null"]}]}},
+                                 "find": {"enum": list(DSU_FINDS)}, "union": {"enum": list(DSU_UNIONS)}},
+                  "required": ["n", "ops"]},
+          estimate=lambda d: len(d["ops"]) + 2, steps="one per operation + 2")
+def simulate_dsu(n: int, ops: List[tuple], find: str = "compression", union: str = "rank"):
+    """Union-find over `ops`, as delta frames.
+
+    `find` is "naive", "compression" (every node on the path is pointed at
+    the root) or "halving" (every node on the path skips to its
+    grandparent); `union` links roots naively, by rank or by size. Finds
+    are iterative, so long chains can't hit the recursion limit. A step
+    sends only the parent entries it rewrote and the path it followed, and
+    the last step sums up pointer hops and rewrites per operation.
+    """
+    if find not in DSU_FINDS:
+        raise ValueError(f"find must be one of {', '.join(DSU_FINDS)}")
+    if union not in DSU_UNIONS:
+        raise ValueError(f"union must be one of {', '.join(DSU_UNIONS)}")
     parent = list(range(n))
-    
-    def find(i):
-        if parent[i] == i: return i
-        return find(parent[i])
-        
-    for op_type, u, v in ops:
+    weight = [1 if union == "size" else 0] * n  # size or rank of each root
+    framer = trace_codec.Framer()
+    totals = {"unions": 0, "merges": 0, "finds": 0, "hops": 0, "rewrites": 0, "longest_path": 0}
+    path = []
+
+    def node(x) -> int:
+        if not isinstance(x, int) or not 0 <= x < n:
+            raise ValueError(f"Node {x} is out of range 0..{n - 1}")
+        return x
+
+    def root_of(x: int, rewrites: List[List[int]]) -> int:
+        start = len(path)
+        if find == "halving":
+            while parent[x] != x:
+                path.append(x)
+                grandparent = parent[parent[x]]
+                if parent[x] != grandparent:
+                    parent[x] = grandparent
+                    rewrites.append([x, grandparent])
+                x = grandparent
+        else:
+            while parent[x] != x:
+                path.append(x)
+                x = parent[x]
+            if find == "compression":
+                for y in path[start:]:
+                    if parent[y] != x:
+                        parent[y] = x
+                        rewrites.append([y, x])
+        path.append(x)
+        hops = len(path) - start - 1
+        totals["hops"] += hops
+        totals["longest_path"] = max(totals["longest_path"], hops)
+        return x
+
+    yield framer.frame({
+        "line": 1,
+        "variables": {"n": n, "find": find, "union": union},
+        "array": parent,
+        "pointers": {},
+        "explanation": f"Each of the {n} nodes starts as its own set"
+    })
+
+    for op in ops:
+        op_type, u = op[0], node(op[1])
+        rewrites = []
+        hops_before = totals["hops"]
+        path.clear()
         if op_type == "union":
-            root_u = find(u)
-            root_v = find(v)
-            if root_u != root_v:
-                parent[root_u] = root_v
-                steps.append({
-                    "line": 5, "variables": {"u": u, "v": v, "rootU": root_u, "rootV": root_v},
-                    "array": list(parent), "pointers": {"u": u, "v": v},
-                    "explanation": f"Connecting component of {u} to component of {v}"
-                })
-        else: # find
-            root = find(u)
-            steps.append({
-                "line": 10, "variables": {"node": u, "root": root},
-                "array": list(parent), "pointers": {"active": u},
-                "explanation": f"Finding root of {u}: Result {root}"
-            })
+            v = node(op[2])
+            totals["unions"] += 1
+            root_u, root_v = root_of(u, rewrites), root_of(v, rewrites)
+            compressed = len(rewrites)
+            variables = {"op": "union", "u": u, "v": v, "root_u": root_u, "root_v": root_v}
+            if root_u == root_v:
+                root = root_u
+                explanation = f"{u} and {v} are already in the same set (root {root})"
+            else:
+                totals["merges"] += 1
+                child, root = root_u, root_v
+                if union != "naive" and weight[root_u] > weight[root_v]:
+                    child, root = root_v, root_u
+                parent[child] = root
+                rewrites.append([child, root])
+                explanation = f"Linked root {child} under root {root}"
+                if union == "rank":
+                    if weight[child] == weight[root]:
+                        weight[root] += 1
+                    explanation += f" (rank {weight[root]})"
+                    variables["rank"] = weight[root]
+                elif union == "size":
+                    weight[root] += weight[child]
+                    explanation += f" (size {weight[root]})"
+                    variables["size"] = weight[root]
+            pointers = {"u": u, "v": v, "root": root}
+            line = 5
+        else:
+            totals["finds"] += 1
+            root = root_of(u, rewrites)
+            compressed = len(rewrites)
+            variables = {"op": "find", "node": u, "root": root}
+            pointers = {"active": u, "root": root}
+            hops = totals["hops"] - hops_before
+            explanation = f"find({u}) = {root} after {hops} parent link{'s' if hops != 1 else ''}"
+            line = 10
+        totals["rewrites"] += compressed
+        if compressed:
+            explanation += f"; {'compressed' if find == 'compression' else 'halved'} the path ({compressed} rewrite{'s' if compressed != 1 else ''})"
+        variables.update(hops=totals["hops"] - hops_before, rewrites=compressed)
+        yield framer.frame({
+            "line": line,
+            "variables": variables,
+            "array": parent,
+            "stack": path,
+            "pointers": pointers,
+            "explanation": explanation
+        }, array={"set": rewrites} if rewrites else None, stack={"replace": list(path)})
+
+    count = len(ops)
+    per_op = round(totals["hops"] / count, 2) if count else 0
+    yield framer.frame({
+        "line": 15,
+        "variables": dict(totals, ops=count, hops_per_op=per_op,
+                          rewrites_per_op=round(totals["rewrites"] / count, 2) if count else 0,
+                          components=n - totals["merges"]),
+        "array": parent,
+        "stack": [],
+        "pointers": {},
+        "explanation": f"Done: {count} operations, {per_op} parent hops per operation on average"
+    }, stack={"replace": []} if path else None)
+
+# ==============================
+# STEP ESTIMATES
+# ==============================
+# Exact where the count is cheap to work out, an upper bound where early
+# exits decide it; backtracking has none, since only the search would tell.
+
+def _factorial_n(data) -> int:
+    return int(data) if isinstance(data, (int, str)) and str(data).isdigit() else 5
+
+def _inversions(arr) -> int:
+    """Pairs i < j with arr[i] > arr[j] (merge sort count)."""
+    if len(arr) < 2:
+        return 0
+    mid = len(arr) // 2
+    left, right = sorted(arr[:mid]), sorted(arr[mid:])
+    count = _inversions(arr[:mid]) + _inversions(arr[mid:])
+    j = 0
+    for x in left:
+        while j < len(right) and right[j] < x:
+            j += 1
+        count += j
+    return count
+
+def _graph_nodes(data) -> int:
+    adj = data.get("adj") or {}
+    nodes = {str(data["start"])} | {str(k) for k in adj}
+    for neighbors in adj.values():
+        nodes.update(str(v) for v in neighbors)
+    for edge in data.get("edges") or ():
+        nodes.update((str(edge[0]), str(edge[1])))
+    return len(nodes)
+
+def _hash_probes(keys, size) -> int:
+    if len(keys) > size:
+        return None  # the table fills up and the simulator probes forever
+    table = [False] * size
+    probes = 0
+    for key in keys:
+        curr = key % size
+        while table[curr]:
+            probes += 1
+            curr = (curr + 1) % size
+        table[curr] = True
+    return probes
+
+def _greedy_steps(amount, coins) -> int:
+    steps = len(coins) + 1
+    for c in sorted(coins, reverse=True):
+        steps += amount // c
+        amount %= c
     return steps
 
+def _dp_steps(n, mode) -> int:
+    if mode == "memo":
+        # Per fib(i), i >= 2: a call and a store, plus a memo hit on fib(i - 2) for i >= 3
+        return 3 * n - 1 if n >= 2 else 2
+    if mode == "tabulation":
+        return n + 2 if n >= 1 else 2
+    return max(n, 1) + 1